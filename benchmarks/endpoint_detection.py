@@ -0,0 +1,66 @@
+"""
+Throughput benchmark for engine.acids_bases.detect_endpoints.
+
+Builds ragged, noisy strong acid–strong base curves (random concentrations,
+sample volume and point count, titrated to twice the equivalence volume),
+pads them into one stack and times a single detect_endpoints call against
+the analytic equivalence volumes.
+
+    python -m benchmarks.endpoint_detection [--curves 5000] [--repeat 5]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from engine import acids_bases
+
+def synthetic_curves(curves, min_points=40, max_points=120, noise=0.02, seed=0):
+    """
+    NaN-padded volume and pH stacks plus the true equivalence volumes
+    """
+    rng = np.random.default_rng(seed)
+    acid_molarity = rng.uniform(0.1, 2.0, curves)
+    acid_volume = rng.uniform(0.01, 0.05, curves)
+    base_molarity = rng.uniform(0.5, 2.0, curves)
+    equivalence = acid_molarity * acid_volume / base_molarity
+
+    lengths = rng.integers(min_points, max_points + 1, curves)
+    volume_list = [np.linspace(0, 2 * eq, n) for eq, n in zip(equivalence, lengths)]
+    volumes, _ = acids_bases.pad_titration_curves(volume_list, volume_list)
+
+    added = np.nan_to_num(volumes)
+    ph = acids_bases.calculate_ph_strong_acid_array(
+        acids_bases.calculate_moles(acid_molarity, acid_volume)[:, np.newaxis],
+        acids_bases.calculate_moles(base_molarity[:, np.newaxis], added),
+        acid_volume[:, np.newaxis] + added
+    )
+    ph = np.clip(ph + rng.normal(0, noise, ph.shape), -1, 15)
+    return volumes, np.where(np.isfinite(volumes), ph, np.nan), equivalence
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--curves", type=int, default=5000)
+    parser.add_argument("--noise", type=float, default=0.02, help="standard deviation of pH noise")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    volumes, ph, equivalence = synthetic_curves(args.curves, noise=args.noise, seed=args.seed)
+    acids_bases.detect_endpoints(volumes, ph)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        endpoints, confidence = acids_bases.detect_endpoints(volumes, ph)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+
+    error = np.abs(endpoints - equivalence) / equivalence
+    print(f"curves: {args.curves} ({volumes.shape[1]} points padded), pH noise {args.noise}")
+    print(f"detect_endpoints: {best:.3f} s best of {args.repeat} ({args.curves / best:,.0f} curves/s)")
+    print(f"relative endpoint error: median {np.median(error):.2%}, 95th percentile {np.percentile(error, 95):.2%}")
+    print(f"confidence: mean {confidence.mean():.2f}, min {confidence.min():.2f}")
+
+if __name__ == "__main__":
+    main()
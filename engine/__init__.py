@@ -1 +1 @@
-from engine import kinetics, thermodynamics, properties, acids_bases, imf
+from engine import database, kinetics, thermodynamics, properties, acids_bases, imf, mechanisms, kinetic_fitting, reactors, decay, optimization, equilibrium, vle, distillation
@@ -6,6 +6,20 @@ KW = 1e-14  # water equilibrium constant
 DEFAULT_EPSILON = 100  # L/(mol·cm)
 PATH_LENGTH = 1  # cm
 
+# Stepwise dissociation constants at 25 °C
+WEAK_ACIDS = {
+    "Acetic Acid": [1.8e-5],
+    "Hydrofluoric Acid": [6.8e-4],
+    "Carbonic Acid": [4.3e-7, 4.8e-11],
+    "Oxalic Acid": [5.9e-2, 6.4e-5],
+    "Phosphoric Acid": [7.5e-3, 6.2e-8, 4.8e-13],
+}
+WEAK_BASES = {
+    "Ammonia": [1.8e-5],
+    "Methylamine": [4.4e-4],
+    "Pyridine": [1.7e-9],
+}
+
 def calculate_moles(M, V):
     return M * V
 
@@ -22,37 +36,584 @@ def calculate_ph_strong_acid(moles_acid, moles_base, total_volume):
     else:
         return 7.0
 
-def generate_titration_curve(
+def calculate_ph_strong_acid_array(moles_acid, moles_base, total_volume):
+    """
+    Array form of calculate_ph_strong_acid; inputs broadcast against each other
+    """
+    excess_h = np.asarray(moles_acid, dtype=float) - np.asarray(moles_base, dtype=float)
+    conc = np.abs(excess_h) / np.asarray(total_volume, dtype=float)
+
+    with np.errstate(divide="ignore"):
+        p_conc = -np.log10(conc)
+
+    return np.where(excess_h > 0, p_conc, np.where(excess_h < 0, 14 - p_conc, 7.0))
+
+def _strong_charge_balance_ph(moles_acid, moles_base, total_volume):
+    """
+    Strong acid/strong base pH from the charge balance h − KW/h = Δ, with Δ
+    the excess acid concentration, so a round-off residue at equivalence
+    stays near pH 7
+    """
+    delta = (np.asarray(moles_acid, dtype=float) - np.asarray(moles_base, dtype=float)) / total_volume
+    root = np.sqrt(delta**2 + 4 * KW)
+    # Each sign uses the cancellation-free form of (Δ + √(Δ² + 4KW)) / 2
+    h = np.where(delta >= 0, 0.5 * (delta + root), 2 * KW / (root - delta))
+    return -np.log10(h)
+
+def titration_ph_matrix(acid_molarity, acid_volume, base_molarity, base_volumes):
+    """
+    pH for every (scenario, titrant volume) pair in one pass.
+
+    acid_molarity, acid_volume and base_molarity broadcast to the scenario
+    shape; the result has shape scenario_shape + base_volumes.shape.
+    """
+    acid_molarity, acid_volume, base_molarity = np.broadcast_arrays(
+        np.asarray(acid_molarity, dtype=float),
+        np.asarray(acid_volume, dtype=float),
+        np.asarray(base_molarity, dtype=float)
+    )
+    base_volumes = np.asarray(base_volumes, dtype=float)
+    expand = (Ellipsis,) + (np.newaxis,) * base_volumes.ndim
+
+    moles_acid = calculate_moles(acid_molarity, acid_volume)[expand]
+    moles_base = calculate_moles(base_molarity[expand], base_volumes)
+
+    return calculate_ph_strong_acid_array(
+        moles_acid,
+        moles_base,
+        acid_volume[expand] + base_volumes
+    )
+
+def generate_titration_batch(
     acid_molarity,
     acid_volume,
     base_molarity,
     max_base_volume,
     points=50
 ):
+    """
+    Titration curves for many scenarios on a shared volume grid.
+
+    Returns (volumes, ph_matrix, equivalence_volumes) where ph_matrix has one
+    row per scenario and one column per titrant volume.
+    """
     volumes = np.linspace(0, max_base_volume, points)
-    ph_values = []
+    ph_matrix = titration_ph_matrix(acid_molarity, acid_volume, base_molarity, volumes)
+    equivalence_volumes = (
+        calculate_moles(np.asarray(acid_molarity, dtype=float), np.asarray(acid_volume, dtype=float))
+        / np.asarray(base_molarity, dtype=float)
+    )
+
+    return volumes, ph_matrix, equivalence_volumes
+
+def adaptive_titration_points(
+    acid_molarity,
+    acid_volume,
+    base_molarity,
+    max_base_volume,
+    tolerance=0.05,
+    initial_points=17,
+    max_points=2000,
+    min_spacing=None
+):
+    """
+    Titrant volumes and pH refined where the curve bends.
+
+    Each pass evaluates the midpoints of the still-active intervals in one
+    array call and splits those whose midpoint pH differs from the linear
+    interpolation by more than `tolerance` pH units. Flat buffer regions stop
+    refining after the first pass; the equivalence volume is always sampled.
+    """
+    if min_spacing is None:
+        min_spacing = max_base_volume * 1e-6
+
+    def ph_at(volumes):
+        return titration_ph_matrix(acid_molarity, acid_volume, base_molarity, volumes)
+
+    volumes = np.linspace(0, max_base_volume, initial_points)
+    equivalence_volume = calculate_moles(acid_molarity, acid_volume) / base_molarity
+    if 0 < equivalence_volume < max_base_volume:
+        volumes = np.union1d(volumes, [equivalence_volume])
+        volumes = volumes[np.r_[True, np.diff(volumes) > min_spacing]]
+
+    ph_values = ph_at(volumes)
+    active = np.ones(volumes.size - 1, dtype=bool)
+
+    while active.any() and volumes.size < max_points:
+        idx = np.flatnonzero(active)
+        mids = 0.5 * (volumes[idx] + volumes[idx + 1])
+        ph_mids = ph_at(mids)
+        error = np.abs(ph_mids - 0.5 * (ph_values[idx] + ph_values[idx + 1]))
+
+        split = (error > tolerance) & (volumes[idx + 1] - volumes[idx] > 2 * min_spacing)
+        split_idx = idx[split][:max_points - volumes.size]
+
+        refine = np.zeros_like(active)
+        refine[split_idx] = True
+        volumes = np.insert(volumes, split_idx + 1, mids[split][:split_idx.size])
+        ph_values = np.insert(ph_values, split_idx + 1, ph_mids[split][:split_idx.size])
+        active = np.repeat(refine, np.where(refine, 2, 1))
+
+    return volumes, ph_values
+
+def _solve_charge_balance(
+    analyte_conc,
+    titrant_conc,
+    log_beta,
+    charge_offset,
+    titrant_sign,
+    ph_guess,
+    tol=1e-9,
+    max_iter=60
+):
+    """
+    Safeguarded Newton solve of the charge balance for pH (1-D batch).
 
-    initial_moles_acid = calculate_moles(acid_molarity, acid_volume)
+    Species j of the analyte carries charge (charge_offset - j) and has
+    cumulative formation constant exp(log_beta[:, j]). The balance is
+    monotonic in pH, so a bisection bracket [-2, 16] is narrowed at every
+    step and used whenever the Newton step leaves it. Converged points drop
+    out of the working set, so stragglers near the equivalence jump do not
+    keep the whole batch iterating.
+    """
+    j = np.arange(log_beta.shape[-1])[:, np.newaxis]
+    result = np.clip(ph_guess, -2.0, 16.0)
+    # Working copies, species-major so reductions over species run along rows
+    x = result.copy()
+    lo = np.full_like(x, -2.0)
+    hi = np.full_like(x, 16.0)
+    c_a = analyte_conc
+    c_t = titrant_sign * titrant_conc
+    log_beta = np.ascontiguousarray(log_beta.T)
+    idx = np.arange(x.size)
 
-    for Vb in volumes:
-        moles_base = calculate_moles(base_molarity, Vb)
-        total_volume = acid_volume + Vb
+    for _ in range(max_iter):
+        log_h = -x * np.log(10)
+        log_terms = log_beta - j * log_h
+        weights = np.exp(log_terms - log_terms.max(axis=0))
+        total = weights.sum(axis=0)
+        mean_j = (j * weights).sum(axis=0) / total
+        var_j = (j**2 * weights).sum(axis=0) / total - mean_j**2
 
-        ph = calculate_ph_strong_acid(
-            initial_moles_acid,
-            moles_base,
-            total_volume
+        h = np.exp(log_h)
+        oh = KW / h
+        f = h - oh + c_t + c_a * (charge_offset - mean_j)
+        slope = -np.log(10) * (h + oh + c_a * var_j)
+
+        lo = np.where(f > 0, x, lo)
+        hi = np.where(f < 0, x, hi)
+        step = f / slope
+        x_new = x - step
+        outside = (x_new < lo) | (x_new > hi)
+        x = np.where(outside, 0.5 * (lo + hi), x_new)
+
+        active = outside | (np.abs(step) >= tol)
+        result[idx] = x
+        if not active.all():
+            idx, x, lo, hi, c_a, c_t = (v[active] for v in (idx, x, lo, hi, c_a, c_t))
+            log_beta = log_beta[:, active]
+        if idx.size == 0:
+            break
+
+    return result
+
+def _charge_balance_titration(
+    analyte_molarity,
+    analyte_volume,
+    titrant_molarity,
+    titrant_volumes,
+    log_beta,
+    charge_offset,
+    titrant_sign
+):
+    analyte_molarity, analyte_volume, titrant_molarity = np.broadcast_arrays(
+        np.asarray(analyte_molarity, dtype=float),
+        np.asarray(analyte_volume, dtype=float),
+        np.asarray(titrant_molarity, dtype=float)
+    )
+    scenario_shape = np.broadcast_shapes(analyte_molarity.shape, log_beta.shape[:-1])
+    titrant_volumes = np.asarray(titrant_volumes, dtype=float)
+
+    def flat(values):
+        return np.broadcast_to(values, scenario_shape).ravel()
+
+    analyte_volume = flat(analyte_volume)
+    titrant_molarity = flat(titrant_molarity)
+    moles_analyte = calculate_moles(flat(analyte_molarity), analyte_volume)
+    log_beta = np.broadcast_to(
+        log_beta, scenario_shape + log_beta.shape[-1:]
+    ).reshape(-1, log_beta.shape[-1])
+
+    # Every scenario × volume point is solved in one batch
+    total_volume = analyte_volume[:, np.newaxis] + titrant_volumes.ravel()[np.newaxis, :]
+    analyte_conc = moles_analyte[:, np.newaxis] / total_volume
+    titrant_conc = calculate_moles(titrant_molarity[:, np.newaxis], titrant_volumes.ravel()) / total_volume
+    ph_guess = _buffer_ph_estimate(analyte_conc, titrant_conc, log_beta, charge_offset)
+
+    ph = _solve_charge_balance(
+        analyte_conc.ravel(),
+        titrant_conc.ravel(),
+        np.repeat(log_beta, titrant_volumes.size, axis=0),
+        charge_offset,
+        titrant_sign,
+        ph_guess.ravel()
+    )
+    return ph.reshape(scenario_shape + titrant_volumes.shape)
+
+def _buffer_ph_estimate(analyte_conc, titrant_conc, log_beta, charge_offset):
+    """
+    Henderson–Hasselbalch starting pH for the charge-balance solve.
+
+    analyte_conc and titrant_conc are (scenarios, volumes), log_beta is
+    (scenarios, species). The titrant sets the mean number of protons
+    removed from the fully protonated analyte; between species m and m + 1
+    the pH is taken as pKa_(m+1) + log10(fraction / (1 − fraction)), held
+    between the equivalence-point midpoints of neighbouring pKa values
+    (−log10 C and 14 + log10 C standing in at the ends, which gives the
+    usual weak acid and weak base formulas). Past the last equivalence point
+    the excess strong acid or base fixes it.
+    """
+    n = log_beta.shape[-1] - 1
+    log_c = np.log10(np.maximum(analyte_conc, 1e-300))
+    ratio = titrant_conc / np.maximum(analyte_conc, 1e-300)
+    # Acid analytes (offset 0) lose one proton per base; bases gain one per acid
+    removed = ratio if charge_offset == 0 else charge_offset - ratio
+
+    pka = np.concatenate([
+        np.full((log_beta.shape[0], 1), np.nan),
+        -np.diff(log_beta, axis=1) / np.log(10),
+        np.full((log_beta.shape[0], 1), np.nan)
+    ], axis=1)
+    m = np.clip(np.floor(removed), 0, n - 1).astype(int)
+    rows = np.arange(log_beta.shape[0])[:, np.newaxis]
+
+    def ladder(k):
+        # pKa_k with the pure-acid and pure-base stand-ins at either end
+        return np.where(k == 0, -log_c, np.where(k == n + 1, 14 + log_c, pka[rows, k]))
+
+    pka_m, pka_buffer, pka_next = ladder(m), ladder(m + 1), ladder(m + 2)
+    fraction = np.clip(removed - m, 1e-12, 1 - 1e-12)
+    ph = pka_buffer + np.log10(fraction / (1 - fraction))
+    ph = np.minimum(np.maximum(ph, 0.5 * (pka_m + pka_buffer)), 0.5 * (pka_buffer + pka_next))
+
+    excess = np.abs(ratio - n) * analyte_conc
+    with np.errstate(divide="ignore"):
+        if charge_offset == 0:
+            ph = np.where(removed > n, np.maximum(14 + np.log10(excess), 0.5 * (pka_buffer + pka_next)), ph)
+        else:
+            ph = np.where(removed < 0, np.minimum(-np.log10(excess), 0.5 * (pka_m + pka_buffer)), ph)
+    return np.clip(ph, -2.0, 16.0)
+
+def _log_beta(k_values):
+    """
+    Cumulative natural-log formation constants, 0 for the fully protonated form
+    """
+    log_k = np.log(np.asarray(k_values, dtype=float))
+    zero = np.zeros(log_k.shape[:-1] + (1,))
+    return np.concatenate([zero, np.cumsum(log_k, axis=-1)], axis=-1)
+
+def polyprotic_titration_ph_matrix(
+    acid_molarity,
+    acid_volume,
+    base_molarity,
+    base_volumes,
+    ka
+):
+    """
+    pH of a weak or polyprotic acid titrated with strong base.
+
+    ka holds Ka1..Kan, either shared (shape (n,)) or per scenario
+    (scenario_shape + (n,)). Solved from the full charge balance including KW.
+    """
+    log_beta = _log_beta(np.atleast_1d(ka))
+    return _charge_balance_titration(
+        acid_molarity,
+        acid_volume,
+        base_molarity,
+        np.atleast_1d(base_volumes),
+        log_beta,
+        charge_offset=0,
+        titrant_sign=1
+    )
+
+def weak_base_titration_ph_matrix(
+    base_molarity,
+    base_volume,
+    acid_molarity,
+    acid_volumes,
+    kb
+):
+    """
+    pH of a weak (poly)base titrated with strong acid, with kb = Kb1..Kbn.
+    """
+    kb = np.atleast_1d(np.asarray(kb, dtype=float))
+    # Conjugate acid H_nB^n+ dissociates with Ka_i = KW / Kb_(n+1-i)
+    ka = KW / kb[..., ::-1]
+    log_beta = _log_beta(ka)
+    return _charge_balance_titration(
+        base_molarity,
+        base_volume,
+        acid_molarity,
+        np.atleast_1d(acid_volumes),
+        log_beta,
+        charge_offset=kb.shape[-1],
+        titrant_sign=-1
+    )
+
+def generate_weak_titration_curve(
+    analyte_molarity,
+    analyte_volume,
+    titrant_molarity,
+    max_titrant_volume,
+    ka=None,
+    kb=None,
+    points=50
+):
+    """
+    Titration curve for a weak acid (ka) or weak base (kb) analyte.
+
+    Returns the DataFrame and the list of equivalence volumes, one per
+    dissociation step.
+    """
+    if ka is None and kb is None:
+        raise ValueError("generate_weak_titration_curve needs ka or kb")
+
+    volumes = np.linspace(0, max_titrant_volume, points)
+
+    if ka is not None:
+        ph_values = polyprotic_titration_ph_matrix(
+            analyte_molarity, analyte_volume, titrant_molarity, volumes, ka
+        )
+        steps = np.atleast_1d(ka).shape[-1]
+    else:
+        ph_values = weak_base_titration_ph_matrix(
+            analyte_molarity, analyte_volume, titrant_molarity, volumes, kb
+        )
+        steps = np.atleast_1d(kb).shape[-1]
+
+    df = pd.DataFrame({
+        "Volume of Titrant Added (L)": volumes,
+        "pH": ph_values
+    })
+
+    moles_analyte = calculate_moles(analyte_molarity, analyte_volume)
+    equivalence_volumes = [
+        n * moles_analyte / titrant_molarity for n in range(1, steps + 1)
+    ]
+
+    return df, equivalence_volumes
+
+def generate_titration_curve(
+    acid_molarity,
+    acid_volume,
+    base_molarity,
+    max_base_volume,
+    points=50,
+    adaptive=False,
+    tolerance=0.05
+):
+    if adaptive:
+        volumes, ph_values = adaptive_titration_points(
+            acid_molarity,
+            acid_volume,
+            base_molarity,
+            max_base_volume,
+            tolerance=tolerance,
+            initial_points=points
+        )
+        equivalence_volume = calculate_moles(acid_molarity, acid_volume) / base_molarity
+    else:
+        volumes, ph_values, equivalence_volume = generate_titration_batch(
+            acid_molarity,
+            acid_volume,
+            base_molarity,
+            max_base_volume,
+            points
         )
-        ph_values.append(ph)
 
     df = pd.DataFrame({
         "Volume of Titrant Added (L)": volumes,
         "pH": ph_values
     })
 
-    equivalence_volume = initial_moles_acid / base_molarity
+    return df, float(equivalence_volume)
+
+def pad_titration_curves(volume_list, ph_list):
+    """
+    Stack ragged measured curves into NaN-padded (curves, points) arrays.
+    """
+    length = max(len(v) for v in volume_list)
+    volumes = np.full((len(volume_list), length), np.nan)
+    ph_values = np.full((len(volume_list), length), np.nan)
+
+    for i, (v, ph) in enumerate(zip(volume_list, ph_list)):
+        volumes[i, :len(v)] = v
+        ph_values[i, :len(ph)] = ph
+
+    return volumes, ph_values
+
+def detect_endpoints(volumes, ph_values, window=5):
+    """
+    Endpoint volumes and confidence for a stack of measured titration curves.
+
+    volumes and ph_values are (curves, points) arrays; padding or missing
+    readings are NaN. Each curve is smoothed with a masked moving average,
+    the first-derivative peak is located with parabolic interpolation and the
+    endpoint is taken at the second-derivative zero crossing beside it.
+    Confidence (0–1) combines how far the peak stands above the curve's
+    median slope with how well the two estimates agree.
+    """
+    volumes = np.atleast_2d(np.asarray(volumes, dtype=float))
+    ph_values = np.atleast_2d(np.asarray(ph_values, dtype=float))
+    valid = np.isfinite(volumes) & np.isfinite(ph_values)
+    n_curves, length = ph_values.shape
+    rows = np.arange(n_curves)
+
+    if length < 3:
+        return np.full(n_curves, np.nan), np.zeros(n_curves)
+
+    # Masked centred moving average via cumulative sums
+    half = window // 2
+    zero = np.zeros((n_curves, 1))
+    ph_sum = np.concatenate([zero, np.cumsum(np.where(valid, ph_values, 0), axis=1)], axis=1)
+    count = np.concatenate([zero, np.cumsum(valid, axis=1)], axis=1)
+    idx = np.arange(length)
+    lo = np.clip(idx - half, 0, length)
+    hi = np.clip(idx + half + 1, 0, length)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        smooth = (ph_sum[:, hi] - ph_sum[:, lo]) / (count[:, hi] - count[:, lo])
+
+        dV = np.diff(volumes, axis=1)
+        valid1 = valid[:, :-1] & valid[:, 1:] & (dV > 0)
+        d1 = np.where(valid1, np.diff(smooth, axis=1) / dV, np.nan)
+        v_mid = 0.5 * (volumes[:, :-1] + volumes[:, 1:])
+
+        slope = np.abs(d1)
+        peak = np.argmax(np.where(valid1, slope, -np.inf), axis=1)
+        peak_slope = slope[rows, peak]
 
-    return df, equivalence_volume
+        # Parabolic refinement of the derivative peak
+        left = np.clip(peak - 1, 0, length - 2)
+        right = np.clip(peak + 1, 0, length - 2)
+        y0, y1, y2 = slope[rows, left], peak_slope, slope[rows, right]
+        offset = 0.5 * (y0 - y2) / (y0 - 2 * y1 + y2)
+        interior = (left < peak) & (right > peak) & np.isfinite(offset)
+        offset = np.where(interior, np.clip(offset, -0.5, 0.5), 0.0)
+        neighbour = np.where(offset < 0, left, right)
+        derivative_endpoint = v_mid[rows, peak] + np.abs(offset) * (
+            v_mid[rows, neighbour] - v_mid[rows, peak]
+        )
+
+        # Inflection: second-derivative sign change on either side of the peak
+        d2 = np.diff(d1, axis=1) / np.diff(v_mid, axis=1)
+        v_mid2 = 0.5 * (v_mid[:, :-1] + v_mid[:, 1:])
+        k0 = np.clip(peak - 1, 0, length - 3)
+        k1 = np.clip(peak, 0, length - 3)
+        a, b = d2[rows, k0], d2[rows, k1]
+        x0, x1 = v_mid2[rows, k0], v_mid2[rows, k1]
+        crossing = (k0 < k1) & (a * b < 0)
+        inflection_endpoint = np.where(crossing, x0 - a * (x1 - x0) / (b - a), derivative_endpoint)
+
+        median_slope = np.nanmedian(np.where(valid1, slope, np.nan), axis=1)
+        sharpness = np.clip(1 - median_slope / peak_slope, 0, 1)
+        spacing = dV[rows, peak]
+        agreement = np.exp(-np.abs(inflection_endpoint - derivative_endpoint) / spacing)
+        confidence = np.where(crossing, sharpness * agreement, 0.5 * sharpness)
+
+    usable = valid.sum(axis=1) >= 3
+    endpoints = np.where(usable, inflection_endpoint, np.nan)
+    confidence = np.where(usable & np.isfinite(confidence), confidence, 0.0)
+
+    return endpoints, confidence
+
+class TitrationStream:
+    """
+    Push-style pH soft sensor for incremental titrant doses.
+
+    Keeps only running totals (moles of acid, titrant volume), so each push
+    is O(1) and memory stays constant however long the feed runs. The
+    titrant volume is a compensated (Kahan) sum, and moles of base and total
+    volume are derived from it rather than accumulated separately. With ka
+    set, pH comes from the charge-balance solver warm-started at the previous
+    reading; otherwise from the strong acid/strong base charge balance with
+    KW. For high-rate weak-acid feeds, push_many amortises the solver over a
+    block of doses.
+    """
+
+    def __init__(self, acid_molarity, acid_volume, base_molarity, ka=None):
+        self.base_molarity = base_molarity
+        self.acid_volume = acid_volume
+        self.moles_acid = calculate_moles(acid_molarity, acid_volume)
+        self.titrant_volume = 0.0
+        self._compensation = 0.0
+        self.samples = 0
+        self.log_beta = None if ka is None else _log_beta(np.atleast_1d(ka))[np.newaxis]
+        self.ph = self._ph(np.array([0.0]), 7.0)[0]
+
+    @property
+    def moles_base(self):
+        return calculate_moles(self.base_molarity, self.titrant_volume)
+
+    @property
+    def total_volume(self):
+        return self.acid_volume + self.titrant_volume
+
+    def _add_volume(self, volume):
+        corrected = volume - self._compensation
+        total = self.titrant_volume + corrected
+        self._compensation = (total - self.titrant_volume) - corrected
+        self.titrant_volume = total
+
+    def _ph(self, titrant_volume, ph_guess):
+        moles_base = calculate_moles(self.base_molarity, titrant_volume)
+        total_volume = self.acid_volume + titrant_volume
+        if self.log_beta is None:
+            return _strong_charge_balance_ph(self.moles_acid, moles_base, total_volume)
+
+        log_beta = np.broadcast_to(self.log_beta, (titrant_volume.size, self.log_beta.shape[-1]))
+        return _solve_charge_balance(
+            self.moles_acid / total_volume,
+            moles_base / total_volume,
+            log_beta,
+            charge_offset=0,
+            titrant_sign=1,
+            ph_guess=np.full(titrant_volume.size, ph_guess)
+        )
+
+    def push(self, volume_increment):
+        """
+        Add one titrant dose (L) and return the new pH.
+        """
+        self._add_volume(volume_increment)
+        self.samples += 1
+        self.ph = self._ph(np.array([self.titrant_volume]), self.ph)[0]
+        return self.ph
+
+    def push_many(self, volume_increments):
+        """
+        Add a block of doses and return the pH after each one.
+        """
+        volume_increments = np.asarray(volume_increments, dtype=float)
+        if volume_increments.size == 0:
+            return np.empty(0)
+
+        titrant_volume = self.titrant_volume + np.cumsum(volume_increments)
+        titrant_volume[-1] = self.titrant_volume + math.fsum(volume_increments)
+        ph_values = self._ph(titrant_volume, self.ph)
+
+        self._add_volume(math.fsum(volume_increments))
+        self.samples += volume_increments.size
+        self.ph = ph_values[-1]
+
+        return ph_values
+
+def stream_titration(volume_increments, acid_molarity, acid_volume, base_molarity, ka=None):
+    """
+    Generator yielding pH for each titrant increment of an iterable feed.
+    """
+    stream = TitrationStream(acid_molarity, acid_volume, base_molarity, ka)
+    for volume_increment in volume_increments:
+        yield stream.push(volume_increment)
 
 def generate_absorbance_data(
     concentration_max,
@@ -70,6 +631,63 @@ def generate_absorbance_data(
 
     return df
 
+class SpectralInverter:
+    """
+    Batched multi-wavelength Beer–Lambert inversion, A = b·E·c.
+
+    epsilon is a (wavelengths × species) absorptivity matrix. It is
+    QR-factorised once; every later call is a single matrix product that
+    returns least-squares concentrations for a whole stack of spectra.
+    """
+
+    def __init__(self, epsilon, path_length=PATH_LENGTH):
+        design = path_length * np.asarray(epsilon, dtype=float)
+        if design.ndim != 2 or design.shape[0] < design.shape[1]:
+            raise ValueError("epsilon must be (wavelengths, species) with wavelengths >= species")
+
+        Q, R = np.linalg.qr(design)
+        diag = np.abs(np.diag(R))
+        if diag.min() <= diag.max() * design.shape[0] * np.finfo(float).eps:
+            raise ValueError("absorptivity matrix is rank deficient")
+
+        self.design = design
+        self.projector = np.linalg.solve(R, Q.T)  # (species, wavelengths)
+
+    def concentrations(self, spectra, return_residual=False):
+        """
+        Concentrations (..., species) for spectra of shape (..., wavelengths)
+        """
+        spectra = np.asarray(spectra, dtype=float)
+        conc = spectra @ self.projector.T
+
+        if return_residual:
+            residual = np.linalg.norm(spectra - conc @ self.design.T, axis=-1)
+            return conc, residual
+        return conc
+
+    def concentrations_from_file(self, path, chunk_size=4096, out_path=None):
+        """
+        Invert spectra stored row-wise in a .npy file without loading it.
+
+        The input is memory-mapped and processed chunk_size rows at a time;
+        with out_path the result is written to a memory-mapped .npy as well.
+        """
+        spectra = np.load(path, mmap_mode="r")
+        shape = (spectra.shape[0], self.projector.shape[0])
+
+        if out_path is None:
+            conc = np.empty(shape)
+        else:
+            conc = np.lib.format.open_memmap(out_path, mode="w+", dtype=float, shape=shape)
+
+        for start in range(0, shape[0], chunk_size):
+            stop = start + chunk_size
+            conc[start:stop] = self.concentrations(spectra[start:stop])
+
+        if out_path is not None:
+            conc.flush()
+        return conc
+
 def calculate_outputs(
     acid_molarity,
     acid_volume,
@@ -0,0 +1,280 @@
+import os
+import re
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+SUBSTANCE_SOURCE = DATA_DIR / "substances.csv"
+SUBSTANCE_DB_ENV = "CHEM_SUBSTANCE_DB"  # path to an alternative .arrow/.parquet/.csv library
+ELEMENT_SOURCE = DATA_DIR / "elements.csv"
+
+# Column units: molar_mass g/mol; melting_point, boiling_point K (CO2's
+# melting point is the triple point, it sublimes at boiling_point);
+# vapor_pressure_298 kPa; internuclear_distance nm; hf J/mol; heat_capacity,
+# cp_solid, cp_liquid, cp_gas J/(g·K); h_fus, h_vap J/g; antoine_a/b/c for
+# log10 P[kPa] = A − B/(C + T[K]), fitted over antoine_t_min..antoine_t_max K;
+# Lennard-Jones lj_sigma nm and lj_epsilon_k (ε/k_B) K. Elements: atomic_mass
+# g/mol, atomic_radius pm (covalent, Cordero 2008), electronegativity
+# (Pauling), ionization_energy kJ/mol (first); group is empty for La–Yb, Ac–No
+
+_FORMULA_TERM = re.compile(r"([A-Z][a-z]?)(\d*)")
+
+def parse_formula(formula):
+    """
+    Element counts of a simple formula, e.g. "CH4" -> {"C": 1, "H": 4}
+    """
+    counts = {}
+    for element, n in _FORMULA_TERM.findall(formula or ""):
+        counts[element] = counts.get(element, 0) + int(n or 1)
+    return counts
+
+def read_columnar(path):
+    """
+    pyarrow Table from an Arrow IPC (.arrow/.feather), Parquet or CSV file.
+
+    Arrow IPC files are memory-mapped, so columns are paged in when first
+    touched instead of being read up front.
+    """
+    import pyarrow as pa
+
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in (".arrow", ".feather", ".ipc"):
+        return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+        return pq.read_table(path, memory_map=True)
+    if suffix == ".csv":
+        import pyarrow.csv as pcsv
+        return pcsv.read_csv(path, convert_options=pcsv.ConvertOptions(strings_can_be_null=True))
+    raise ValueError(f"unsupported table format '{suffix}', expected .arrow, .feather, .parquet or .csv")
+
+def load_columnar(path):
+    """
+    read_columnar, with CSV sources compiled once to an Arrow file next to
+    them (rebuilt when the CSV is newer) and memory-mapped from then on.
+    Falls back to the in-memory CSV table if the directory is read-only.
+    """
+    path = Path(path)
+    if path.suffix.lower() != ".csv":
+        return read_columnar(path)
+
+    compiled = path.with_suffix(".arrow")
+    if compiled.exists() and compiled.stat().st_mtime >= path.stat().st_mtime:
+        return read_columnar(compiled)
+
+    table = read_columnar(path)
+    try:
+        import pyarrow as pa
+
+        partial = compiled.with_suffix(f".arrow.{os.getpid()}")
+        with pa.OSFile(str(partial), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(partial, compiled)
+    except OSError:
+        return table
+    return read_columnar(compiled)
+
+class ColumnarTable:
+    """
+    Read-only keyed access to a pyarrow Table.
+
+    Every value of the key columns maps to its row through one dict, built on
+    the first lookup; columns are converted to NumPy once and cached, nulls
+    becoming NaN (numeric, promoted to float) or None (text).
+    """
+
+    def __init__(self, table, keys):
+        self.table = table
+        self.keys = tuple(keys)
+        self._index = None
+        self._columns = {}
+
+    def __len__(self):
+        return self.table.num_rows
+
+    @property
+    def columns(self):
+        return list(self.table.column_names)
+
+    def _key_values(self):
+        return [self.table.column(key).to_pylist() for key in self.keys]
+
+    @property
+    def index(self):
+        if self._index is None:
+            index = {}
+            # Earlier key columns win when the same value appears twice
+            for values in reversed(self._key_values()):
+                index.update((value, row) for row, value in enumerate(values) if value is not None)
+            self._index = index
+        return self._index
+
+    def row(self, key):
+        try:
+            return self.index[key]
+        except KeyError:
+            raise KeyError(f"unknown entry '{key}'") from None
+
+    def rows(self, keys):
+        """
+        Row numbers for a list of keys, or all rows for None
+        """
+        if keys is None:
+            return np.arange(len(self))
+        if isinstance(keys, str):
+            keys = [keys]
+        index = self.index
+        unknown = [key for key in keys if key not in index]
+        if unknown:
+            raise KeyError(f"unknown entries: {', '.join(map(str, unknown))}")
+        return np.fromiter((index[key] for key in keys), dtype=np.intp, count=len(keys))
+
+    def column(self, name, rows=None):
+        if name not in self._columns:
+            import pyarrow as pa
+
+            data = self.table.column(name)
+            if pa.types.is_integer(data.type) and data.null_count == 0:
+                values = data.to_numpy()
+            elif pa.types.is_integer(data.type) or pa.types.is_floating(data.type):
+                values = data.cast(pa.float64()).fill_null(np.nan).to_numpy()
+            else:
+                values = np.array(data.to_pylist(), dtype=object)
+            self._columns[name] = values
+        values = self._columns[name]
+        return values if rows is None else values[rows]
+
+    def present(self, name):
+        """
+        Rows where column name is not null
+        """
+        return np.flatnonzero(self.table.column(name).is_valid().to_numpy(zero_copy_only=False))
+
+    def record(self, key):
+        row = self.row(key)
+        return {name: self.table.column(name)[row].as_py() for name in self.table.column_names}
+
+class SubstanceDatabase(ColumnarTable):
+    """
+    Substance property table indexed by name, formula, CAS number and the
+    "Name (formula)" label used by the thermodynamics pages.
+    """
+
+    def __init__(self, table):
+        super().__init__(table, keys=("name", "formula", "cas"))
+
+    def labels(self, rows=None):
+        names = self.column("name", rows)
+        formulas = self.column("formula", rows)
+        return [f"{n} ({f})" for n, f in zip(names, formulas)]
+
+    def _key_values(self):
+        return [self.labels()] + super()._key_values()
+
+_default_database = None
+_generation = 0
+
+def substance_database():
+    """
+    The shared SubstanceDatabase, loaded on first use from $CHEM_SUBSTANCE_DB
+    or the bundled table.
+    """
+    global _default_database
+    if _default_database is None:
+        _default_database = SubstanceDatabase(load_columnar(os.environ.get(SUBSTANCE_DB_ENV) or SUBSTANCE_SOURCE))
+    return _default_database
+
+_element_table = None
+
+def element_table():
+    """
+    The periodic table as a ColumnarTable keyed by symbol, name and atomic
+    number, loaded on first use
+    """
+    global _element_table
+    if _element_table is None:
+        _element_table = ColumnarTable(load_columnar(ELEMENT_SOURCE), keys=("symbol", "name", "atomic_number"))
+    return _element_table
+
+def use_substance_database(source):
+    """
+    Replace the shared database with a file path, pyarrow Table or
+    SubstanceDatabase; views and cached tables are rebuilt on next access.
+    """
+    global _default_database, _generation
+    if isinstance(source, (str, os.PathLike)):
+        source = load_columnar(source)
+    if not isinstance(source, SubstanceDatabase):
+        source = SubstanceDatabase(source)
+    _default_database = source
+    _generation += 1
+
+def cached_on_database(function):
+    """
+    Cache a no-argument function until the shared database is replaced
+    """
+    cache = {}
+
+    def wrapper():
+        if cache.get("generation") != _generation:
+            cache["value"] = function()
+            cache["generation"] = _generation
+        return cache["value"]
+
+    wrapper.__doc__ = function.__doc__
+    wrapper.__name__ = function.__name__
+    return wrapper
+
+class SubstanceView(Mapping):
+    """
+    Dict-style view of the shared database with module-specific field names.
+
+    fields maps output names to columns (or (column, converter) pairs); a
+    single column name makes each value a scalar. key is a column or "label";
+    only rows with a value in require are included. extra entries come first.
+    The view is materialized on first access and after the database changes.
+    """
+
+    def __init__(self, fields, key="formula", require=None, extra=None):
+        self.fields = fields
+        self.key = key
+        self.require = require
+        self.extra = dict(extra or {})
+        self._data = None
+        self._generation = None
+
+    def _field(self, db, rows, spec):
+        column, convert = spec if isinstance(spec, tuple) else (spec, None)
+        values = db.column(column, rows).tolist()
+        return [convert(v) for v in values] if convert else values
+
+    def _materialize(self):
+        if self._data is None or self._generation != _generation:
+            db = substance_database()
+            rows = db.rows(None) if self.require is None else db.present(self.require)
+            keys = db.labels(rows) if self.key == "label" else db.column(self.key, rows).tolist()
+
+            if isinstance(self.fields, Mapping):
+                columns = {name: self._field(db, rows, spec) for name, spec in self.fields.items()}
+                values = [dict(zip(columns, row)) for row in zip(*columns.values())] if columns else []
+            else:
+                values = self._field(db, rows, self.fields)
+
+            self._data = {**self.extra, **dict(zip(keys, values))}
+            self._generation = _generation
+        return self._data
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._materialize()!r})"
@@ -0,0 +1,173 @@
+import numpy as np
+
+from engine.imf import P_ATM, boiling_temperature, vapor_pressure
+
+def relative_volatility(light, heavy, P=P_ATM):
+    """
+    Constant relative volatility of a binary pair at pressure P (kPa).
+
+    α = P_sat,light / P_sat,heavy from the database vapor pressures,
+    averaged geometrically between the two normal boiling temperatures at P.
+    Raises ValueError unless light is the more volatile component (α > 1).
+    """
+    components = [light, heavy]
+    T_b = boiling_temperature(components, P, extrapolate=True)[:, 0]
+    p_sat = vapor_pressure(components, T_b, extrapolate=True)  # (components, temperatures)
+    alpha = float(np.sqrt(np.prod(p_sat[0] / p_sat[1])))
+
+    if not np.isfinite(alpha) or alpha <= 1:
+        raise ValueError(
+            f"relative volatility of {light} over {heavy} is {alpha:.3g}; "
+            "pass the more volatile (light) component first"
+        )
+    return alpha
+
+def equilibrium_y(x, alpha):
+    """
+    Vapor mole fraction of the light key in equilibrium with liquid x
+    """
+    return alpha * x / (1 + (alpha - 1) * x)
+
+def equilibrium_x(y, alpha):
+    """
+    Liquid mole fraction of the light key in equilibrium with vapor y
+    """
+    return y / (alpha - (alpha - 1) * y)
+
+def fenske_stages(alpha, xD, xB):
+    """
+    Minimum theoretical stages at total reflux (reboiler included)
+    """
+    separation = (xD / (1 - xD)) * ((1 - xB) / xB)
+    return np.log(separation) / np.log(alpha)
+
+def minimum_reflux(alpha, zF, xD, q):
+    """
+    Underwood minimum reflux ratio for a binary feed of quality q.
+
+    The Underwood root θ in (1, α) of αz/(α − θ) + (1 − z)/(1 − θ) = 1 − q
+    is the relevant root of a quadratic (linear for a saturated liquid,
+    q = 1); R_min = αx_D/(α − θ) + (1 − x_D)/(1 − θ) − 1. For a binary with
+    constant α this equals the McCabe–Thiele pinch. alpha, zF, xD and q
+    broadcast.
+    """
+    alpha, zF, xD, q = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (alpha, zF, xD, q)))
+    a = 1 - q
+    b = (alpha * zF + 1 - zF) - a * (alpha + 1)
+    c = -q * alpha
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(b**2 - 4 * a * c)
+        # Roots of aθ² + bθ + c = 0, with the cancellation-free form for each sign
+        theta_1 = np.where(b >= 0, (-b - root) / (2 * a), 2 * c / (-b + root))
+        theta_2 = np.where(b >= 0, 2 * c / (-b - root), (-b + root) / (2 * a))
+        theta_linear = -c / b
+
+    in_range = lambda t: (t > 1) & (t < alpha)
+    theta = np.where(np.abs(a) < 1e-12, theta_linear, np.where(in_range(theta_1), theta_1, theta_2))
+
+    return alpha * xD / (alpha - theta) + (1 - xD) / (1 - theta) - 1
+
+def gilliland_stages(N_min, R, R_min):
+    """
+    Theoretical stages at reflux R from the Gilliland correlation
+    (Molokanov form)
+    """
+    X = (R - R_min) / (R + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Y = 1 - np.exp((1 + 54.4 * X) / (11 + 117.2 * X) * (X - 1) / np.sqrt(X))
+    return np.where(X > 0, (Y + N_min) / (1 - Y), np.inf)
+
+def _operating_intersection(zF, xD, R, q):
+    """
+    Point where the rectifying line meets the q-line
+    """
+    x = (zF * (R + 1) + xD * (q - 1)) / (R + q)
+    y = (R * x + xD) / (R + 1)
+    return x, y
+
+def mccabe_thiele(alpha, zF, xD, xB, R, q=1.0, max_stages=200):
+    """
+    Stage-by-stage McCabe–Thiele stepping for a batch of column designs.
+
+    Constant molar overflow and constant α, total condenser. Every design
+    (alpha, zF, xD, xB, R and q broadcast) is stepped from the top at once,
+    switching from the rectifying to the stripping line at the optimal feed
+    stage. Returns theoretical stages (reboiler included, the last one
+    fractional), the feed stage and a feasible flag; designs that pinch
+    (R <= R_min) or need more than max_stages get NaN stages.
+    """
+    alpha, zF, xD, xB, R, q = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (alpha, zF, xD, xB, R, q))
+    )
+    shape = alpha.shape
+    alpha, zF, xD, xB, R, q = (v.ravel() for v in (alpha, zF, xD, xB, R, q))
+
+    x_int, y_int = _operating_intersection(zF, xD, R, q)
+    stripping_slope = (y_int - xB) / (x_int - xB)
+
+    stages = np.full(alpha.size, np.nan)
+    feed_stage = np.zeros(alpha.size, dtype=int)
+    x_previous = xD.copy()
+    y = xD.copy()
+    active = np.arange(alpha.size)
+
+    for stage in range(1, max_stages + 1):
+        x = equilibrium_x(y, alpha[active])
+
+        below_feed = x <= x_int[active]
+        new_feed = below_feed & (feed_stage[active] == 0)
+        feed_stage[active[new_feed]] = stage
+
+        done = x <= xB[active]
+        fraction = (x_previous - xB[active]) / (x_previous - x)
+        stages[active[done]] = stage - 1 + fraction[done]
+
+        # A step that makes no progress means the lines touch the curve
+        pinched = x_previous - x <= 1e-12
+
+        y = np.where(
+            below_feed,
+            xB[active] + stripping_slope[active] * (x - xB[active]),
+            (R[active] * x + xD[active]) / (R[active] + 1)
+        )
+        keep = ~(done | pinched)
+        active, x_previous, y = active[keep], x[keep], y[keep]
+        if active.size == 0:
+            break
+
+    feasible = np.isfinite(stages)
+    return {
+        "stages": stages.reshape(shape),
+        "feed_stage": np.where(feasible, feed_stage, 0).reshape(shape),
+        "feasible": feasible.reshape(shape),
+    }
+
+def design_grid(alpha, zF, xD, xB, R, q, max_stages=200):
+    """
+    Shortcut and stage-stepping results over a reflux × feed-quality grid.
+
+    alpha comes from relative_volatility (or is given directly). Returns
+    columnar arrays, one entry per design with R varying slowest: R, q,
+    Fenske N_min, Underwood R_min, Gilliland N, McCabe–Thiele stages and
+    feed stage, and feasibility (R > R_min).
+    """
+    R = np.atleast_1d(np.asarray(R, dtype=float))
+    q = np.atleast_1d(np.asarray(q, dtype=float))
+    R_grid, q_grid = (g.ravel() for g in np.meshgrid(R, q, indexing="ij"))
+
+    N_min = np.broadcast_to(fenske_stages(alpha, xD, xB), R_grid.shape)
+    R_min = minimum_reflux(alpha, zF, xD, q_grid)
+    stepped = mccabe_thiele(alpha, zF, xD, xB, R_grid, q_grid, max_stages)
+    feasible = (R_grid > R_min) & stepped["feasible"]
+
+    return {
+        "R": R_grid,
+        "q": q_grid,
+        "N_min": N_min,
+        "R_min": R_min,
+        "N_gilliland": np.where(R_grid > R_min, gilliland_stages(N_min, R_grid, R_min), np.nan),
+        "stages": np.where(feasible, stepped["stages"], np.nan),
+        "feed_stage": stepped["feed_stage"],
+        "feasible": feasible,
+    }
@@ -0,0 +1,146 @@
+import numpy as np
+
+from engine.thermodynamics import R, SPECIES, NASA_SPECIES, nasa_properties
+
+P_STANDARD = 100.0  # kPa (1 bar standard state)
+TRACE = 1e-30  # mole-fraction floor for species driven out of the mixture
+
+def element_matrix(species):
+    """
+    (elements, species) atom counts from the "elements" entries of SPECIES
+    """
+    elements = sorted({e for s in species for e in SPECIES[s]["elements"]})
+    A = np.array([[SPECIES[s]["elements"].get(e, 0) for s in species] for e in elements], dtype=float)
+    return elements, A
+
+def _feed_array(feed, species):
+    if not isinstance(feed, dict):
+        return np.atleast_2d(np.asarray(feed, dtype=float))
+
+    unknown = sorted(set(feed) - set(species))
+    if unknown:
+        raise ValueError(f"unknown species: {', '.join(unknown)}")
+
+    values = {s: np.atleast_1d(np.asarray(v, dtype=float)) for s, v in feed.items()}
+    batch = max(v.size for v in values.values())
+    moles = np.zeros((batch, len(species)))
+    for s, v in values.items():
+        moles[:, species.index(s)] = v
+    return moles
+
+def equilibrium_composition(
+    feed,
+    T,
+    P=P_STANDARD,
+    species=None,
+    initial=None,
+    tol=1e-9,
+    max_iter=200
+):
+    """
+    Ideal-gas equilibrium by minimizing total Gibbs energy at fixed T (K) and
+    P (kPa, as in imf and vle).
+
+    feed is a dict {species: moles or array} or a (feeds, species) array;
+    every feed in the batch is solved simultaneously. The element-potential
+    Newton iteration (Gordon & McBride) updates ln n_i with a step limit of
+    2 for major species and lets trace species fall freely. initial seeds the
+    iteration, e.g. with the solution at a neighbouring T/P. Species whose
+    elements are absent from a feed are held at zero. Returns moles
+    (feeds, species) and a per-feed converged flag; feeds that exhaust
+    max_iter are returned unconverged and need not satisfy the element
+    balance.
+    """
+    species = list(NASA_SPECIES if species is None else species)
+    elements, A = element_matrix(species)
+    feed = _feed_array(feed, species)
+    batch, n_species = feed.shape
+    n_elements = len(elements)
+
+    b = feed @ A.T  # (feeds, elements)
+    present = b > 0
+    allowed = ~np.any((A.T[np.newaxis] > 0) & ~present[:, np.newaxis, :], axis=2)
+
+    cp, h, s = nasa_properties(T, species)
+    mu0 = (h - T * s) / (R * T) + np.log(P / P_STANDARD)  # (species,)
+
+    if initial is None:
+        n = np.where(allowed, 0.1 / np.maximum(allowed.sum(axis=1, keepdims=True), 1), 0.0)
+    else:
+        n = np.where(allowed, np.maximum(initial, TRACE), 0.0)
+    n_total = n.sum(axis=1)
+
+    identity_rows = np.eye(n_elements + 1)
+    converged = np.zeros(batch, dtype=bool)
+    for _ in range(max_iter):
+        with np.errstate(divide="ignore"):
+            mu = np.where(allowed, mu0 + np.log(n / n_total[:, np.newaxis]), 0.0)
+
+        An = A[np.newaxis] * n[:, np.newaxis, :]  # (feeds, elements, species)
+        M = np.zeros((batch, n_elements + 1, n_elements + 1))
+        M[:, :n_elements, :n_elements] = An @ A.T
+        M[:, :n_elements, n_elements] = An.sum(axis=2)
+        M[:, n_elements, :n_elements] = An.sum(axis=2)
+        M[:, n_elements, n_elements] = n.sum(axis=1) - n_total
+
+        rhs = np.empty((batch, n_elements + 1))
+        rhs[:, :n_elements] = b - An.sum(axis=2) + np.einsum("bes,bs->be", An, mu)
+        rhs[:, n_elements] = n_total - n.sum(axis=1) + np.sum(n * mu, axis=1)
+
+        # Elements missing from a feed get π = 0
+        absent = np.concatenate([~present, np.zeros((batch, 1), dtype=bool)], axis=1)
+        M = np.where(absent[:, :, np.newaxis] | absent[:, np.newaxis, :], 0.0, M)
+        M = np.where(absent[:, :, np.newaxis], identity_rows, M)
+        rhs = np.where(absent, 0.0, rhs)
+
+        solution = np.linalg.solve(M, rhs[..., np.newaxis])[..., 0]
+        pi, d_ln_total = solution[:, :n_elements], solution[:, n_elements]
+        d_ln_n = np.where(allowed, pi @ A - mu + d_ln_total[:, np.newaxis], 0.0)
+
+        fraction = n / n_total[:, np.newaxis]
+        limited = allowed & ((fraction > 1e-8) | (d_ln_n > 0))
+        largest = np.maximum(np.max(np.where(limited, np.abs(d_ln_n), 0.0), axis=1), np.abs(d_ln_total))
+        step = np.minimum(1.0, 2.0 / np.maximum(largest, 1e-300))
+
+        converged = np.max(n * np.abs(d_ln_n), axis=1) <= tol * n.sum(axis=1)
+        converged &= np.abs(d_ln_total) <= tol
+        if converged.all():
+            break
+
+        n_total = n_total * np.exp(step * d_ln_total)
+        n = np.where(
+            allowed,
+            np.maximum(n * np.exp(step[:, np.newaxis] * d_ln_n), TRACE * n_total[:, np.newaxis]),
+            0.0
+        )
+
+    return n, converged
+
+def equilibrium_sweep(feed, T_values, P_values, species=None, **kwargs):
+    """
+    Equilibrium over a T × P grid for a batch of feeds.
+
+    The grid is walked in serpentine order (P sweeps back and forth at each
+    T) and every point is warm-started from its neighbour's solution.
+    Returns moles of shape (len(T_values), len(P_values), feeds, species)
+    and converged flags of shape (len(T_values), len(P_values), feeds).
+    """
+    species = list(NASA_SPECIES if species is None else species)
+    T_values = np.atleast_1d(T_values)
+    P_values = np.atleast_1d(P_values)
+
+    result = converged = None
+    previous = None
+    for i, T in enumerate(T_values):
+        order = range(P_values.size) if i % 2 == 0 else range(P_values.size - 1, -1, -1)
+        for j in order:
+            previous, ok = equilibrium_composition(
+                feed, T, P_values[j], species=species, initial=previous, **kwargs
+            )
+            if result is None:
+                result = np.empty((T_values.size, P_values.size) + previous.shape)
+                converged = np.empty((T_values.size, P_values.size) + ok.shape, dtype=bool)
+            result[i, j] = previous
+            converged[i, j] = ok
+
+    return result, converged
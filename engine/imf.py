@@ -1,58 +1,224 @@
 import numpy as np
 import pandas as pd
 import math
+from itertools import product
+
+from engine.database import SubstanceView, substance_database
 
 R = 8.314  # J/(mol·K)
 A = 1e5    # arbitrary constant for potential energy curve
 B = 1e3    # repulsive constant
+P_ATM = 101.325  # kPa
+VAPOR_PRESSURE_MODELS = ("antoine", "clausius-clapeyron")
+LJ_CUTOFF = 2.5  # pair cutoff in units of σ
+ANTOINE_RANGE_TOLERANCE = 0.5  # K allowed beyond a published fit range
 
-SUBSTANCES = {
-    "H2O": {
-        "molar_mass": 18,
-        "melting_point": 273,
-        "boiling_point": 373,
-        "vapor_pressure_298": 3.2,
-        "imf": "Hydrogen Bonding",
-        "internuclear_distance": 0.096
-    },
-    "CH4": {
-        "molar_mass": 16,
-        "melting_point": 91,
-        "boiling_point": 112,
-        "vapor_pressure_298": 45,
-        "imf": "London Dispersion",
-        "internuclear_distance": 0.109
-    },
-    "CO2": {
-        "molar_mass": 44,
-        "melting_point": 217,
-        "boiling_point": 194,
-        "vapor_pressure_298": 57,
-        "imf": "London Dispersion",
-        "internuclear_distance": 0.116
+SUBSTANCES = SubstanceView(
+    {
+        "molar_mass": "molar_mass",
+        "melting_point": "melting_point",
+        "boiling_point": "boiling_point",
+        "vapor_pressure_298": "vapor_pressure_298",
+        "imf": "imf",
+        "internuclear_distance": "internuclear_distance",
     },
-    "NH3": {
-        "molar_mass": 17,
-        "melting_point": 195,
-        "boiling_point": 240,
-        "vapor_pressure_298": 8.5,
-        "imf": "Hydrogen Bonding",
-        "internuclear_distance": 0.101
-    }
-}
-
-def potential_energy_curve(r_values):
-    return (A / r_values**12) - (B / r_values**6)
-
-def generate_potential_energy_data():
-    r = np.linspace(0.05, 0.5, 200)
-    pe = potential_energy_curve(r)
+    require="vapor_pressure_298"
+)
+
+def lj_parameters(substances):
+    """
+    Lennard-Jones σ (nm) and ε (kJ/mol) for each substance
+    """
+    db = substance_database()
+    rows = db.rows(substances)
+    return db.column("lj_sigma", rows), db.column("lj_epsilon_k", rows) * R / 1000
+
+def lennard_jones(r, sigma, epsilon):
+    """
+    U(r) = 4ε[(σ/r)^12 − (σ/r)^6]; r, σ and ε broadcast
+    """
+    s6 = (sigma / r) ** 6
+    return 4 * epsilon * (s6**2 - s6)
+
+def lj_minimum(substances):
+    """
+    Location r_min = 2^(1/6)·σ (nm) and depth U(r_min) = −ε (kJ/mol) of each well
+    """
+    sigma, epsilon = lj_parameters(substances)
+    return 2 ** (1 / 6) * sigma, -epsilon
+
+def potential_energy_curve(r_values, substances=None):
+    """
+    Legacy A/r^12 − B/r^6 curve, or with substances the Lennard-Jones
+    curves (kJ/mol) of shape (substances, len(r_values))
+    """
+    if substances is None:
+        return (A / r_values**12) - (B / r_values**6)
+
+    sigma, epsilon = lj_parameters(substances)
+    return lennard_jones(np.asarray(r_values)[np.newaxis, :], sigma[:, np.newaxis], epsilon[:, np.newaxis])
+
+def generate_potential_energy_data(substances=None, points=200):
+    if substances is None:
+        r = np.linspace(0.05, 0.5, points)
+        pe = potential_energy_curve(r)
+
+        return pd.DataFrame({
+            "Internuclear Distance (nm)": r,
+            "Potential Energy": pe
+        })
+
+    # Sample each curve from the repulsive wall to 3σ
+    sigma, epsilon = lj_parameters(substances)
+    r = sigma[:, np.newaxis] * np.linspace(0.9, 3.0, points)[np.newaxis, :]
+    pe = lennard_jones(r, sigma[:, np.newaxis], epsilon[:, np.newaxis])
 
     return pd.DataFrame({
-        "Internuclear Distance (nm)": r,
-        "Potential Energy": pe
+        "Substance": np.repeat(list(substances), points),
+        "Internuclear Distance (nm)": r.ravel(),
+        "Potential Energy (kJ/mol)": pe.ravel()
     })
 
+def _cell_offsets(n_cells, periodic):
+    """
+    Half shell of neighbour-cell offsets, so each cell pair is visited once.
+    Dimensions with too few cells to tell −1 from +1 apart get offset 0 only.
+    """
+    axes = [(-1, 0, 1) if n >= (3 if periodic else 2) else (0,) for n in n_cells]
+    return [o for o in product(*axes) if any(o) and next(v for v in o if v) > 0]
+
+def neighbor_pairs(positions, cutoff, box=None, chunk_size=8192):
+    """
+    Index arrays (i, j), i != j, of all particle pairs closer than cutoff.
+
+    Particles are binned into cells at least cutoff wide and only the same
+    and adjacent cells are searched, so the cost is O(N) at fixed density.
+    box gives periodic box lengths (minimum image; each must be >= 2·cutoff)
+    or None for open boundaries. Candidates are generated chunk_size
+    particles at a time to bound memory.
+    """
+    x = np.asarray(positions, dtype=float)
+    n, dim = x.shape
+    periodic = box is not None
+
+    if periodic:
+        box = np.broadcast_to(np.asarray(box, dtype=float), (dim,))
+        if np.any(box < 2 * cutoff):
+            raise ValueError("box lengths must be at least twice the cutoff")
+        x = np.mod(x, box)
+        origin, extent = np.zeros(dim), box
+    else:
+        origin = x.min(axis=0)
+        extent = x.max(axis=0) - origin
+
+    n_cells = np.maximum((extent // cutoff).astype(int), 1)
+    if periodic:
+        n_cells = np.where(n_cells >= 3, n_cells, 1)
+    cell_size = np.where(extent > 0, extent / n_cells, 1.0)
+    cell = np.minimum(((x - origin) // cell_size).astype(int), n_cells - 1)
+
+    cell_id = np.ravel_multi_index(cell.T, n_cells)
+    order = np.argsort(cell_id, kind="stable")
+    cell, cell_id, x_sorted = cell[order], cell_id[order], x[order]
+    counts = np.bincount(cell_id, minlength=int(np.prod(n_cells)))
+    starts = np.cumsum(counts) - counts
+    position = np.arange(n)
+
+    i_parts, j_parts = [], []
+    offsets = [None] + _cell_offsets(n_cells, periodic)
+    for lo in range(0, n, chunk_size):
+        block = slice(lo, min(lo + chunk_size, n))
+        for offset in offsets:
+            if offset is None:
+                # Same cell: only partners later in the sorted order
+                first = position[block] + 1
+                count = starts[cell_id[block]] + counts[cell_id[block]] - first
+            else:
+                neighbour = cell[block] + np.asarray(offset)
+                if periodic:
+                    neighbour %= n_cells
+                    valid = np.ones(neighbour.shape[0], dtype=bool)
+                else:
+                    valid = np.all((neighbour >= 0) & (neighbour < n_cells), axis=1)
+                    neighbour = np.clip(neighbour, 0, n_cells - 1)
+                neighbour_id = np.ravel_multi_index(neighbour.T, n_cells)
+                first = starts[neighbour_id]
+                count = np.where(valid, counts[neighbour_id], 0)
+
+            i = np.repeat(position[block], count)
+            j = np.repeat(first - np.cumsum(count) + count, count) + np.arange(count.sum())
+
+            d = x_sorted[j] - x_sorted[i]
+            if periodic:
+                d -= box * np.round(d / box)
+            close = np.einsum("ij,ij->i", d, d) < cutoff**2
+            i_parts.append(order[i[close]])
+            j_parts.append(order[j[close]])
+
+    return np.concatenate(i_parts), np.concatenate(j_parts)
+
+def lj_energy_forces(positions, sigma, epsilon, box=None, cutoff=None, pairs=None):
+    """
+    Total Lennard-Jones energy and per-particle forces of a configuration.
+
+    positions are (N, dim) in nm; sigma and epsilon are scalars or
+    per-particle arrays (mixed with Lorentz–Berthelot rules), e.g. from
+    lj_parameters. The potential is truncated (not shifted) at cutoff,
+    default LJ_CUTOFF·max σ. pairs from neighbor_pairs with a larger cutoff
+    can be reused across calls as a Verlet list. Returns energy (kJ/mol)
+    and forces (N, dim) in kJ/(mol·nm).
+    """
+    x = np.asarray(positions, dtype=float)
+    n, dim = x.shape
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (n,))
+    epsilon = np.broadcast_to(np.asarray(epsilon, dtype=float), (n,))
+    if cutoff is None:
+        cutoff = LJ_CUTOFF * sigma.max()
+
+    i, j = neighbor_pairs(x, cutoff, box) if pairs is None else pairs
+    d = x[j] - x[i]
+    if box is not None:
+        box = np.broadcast_to(np.asarray(box, dtype=float), (dim,))
+        d -= box * np.round(d / box)
+    r2 = np.einsum("ij,ij->i", d, d)
+    inside = r2 < cutoff**2
+    i, j, d, r2 = i[inside], j[inside], d[inside], r2[inside]
+
+    s2 = ((sigma[i] + sigma[j]) / 2) ** 2 / r2
+    e = np.sqrt(epsilon[i] * epsilon[j])
+    s6 = s2**3
+    energy = np.sum(4 * e * (s6**2 - s6))
+
+    # f·d is the force on j from i (repulsive for positive f)
+    f = (24 * e * (2 * s6**2 - s6) / r2)[:, np.newaxis] * d
+    forces = np.stack(
+        [np.bincount(j, f[:, k], minlength=n) - np.bincount(i, f[:, k], minlength=n) for k in range(dim)],
+        axis=1
+    )
+    return energy, forces
+
+def fcc_lattice(cells, a):
+    """
+    Face-centred cubic positions (4·cells³ particles) with lattice constant
+    a, plus the periodic box length
+    """
+    basis = np.array([[0, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0.5], [0, 0.5, 0.5]])
+    corners = np.stack(np.meshgrid(*[np.arange(cells)] * 3, indexing="ij"), axis=-1).reshape(-1, 1, 3)
+    return ((corners + basis) * a).reshape(-1, 3), cells * a
+
+def cohesive_energy(substance, cells=10, a=None, cutoff=None):
+    """
+    Cohesive energy (kJ/mol, positive when bound) of an fcc crystal of a
+    Lennard-Jones substance, with the lattice constant defaulting to the
+    nearest-neighbour distance at the pair minimum.
+    """
+    (sigma,), (epsilon,) = lj_parameters([substance])
+    if a is None:
+        a = np.sqrt(2) * 2 ** (1 / 6) * sigma
+    positions, box = fcc_lattice(cells, a)
+    energy, _ = lj_energy_forces(positions, sigma, epsilon, box=box, cutoff=cutoff)
+    return -energy / len(positions)
+
 def generate_bp_mp_vs_molar_mass():
     rows = []
 
@@ -69,13 +235,107 @@ def generate_bp_mp_vs_molar_mass():
 def vapor_pressure_curve(vp_298, temperature_range):
     return vp_298 * np.exp(0.05 * (temperature_range - 298))
 
-def generate_vapor_pressure_data(substance, T_min=250, T_max=400):
-    T = np.linspace(T_min, T_max, 50)
-    vp = vapor_pressure_curve(
-        SUBSTANCES[substance]["vapor_pressure_298"],
-        T
+def _vapor_pressure_coefficients(substances, model):
+    """
+    Per-substance model coefficients from the database as (substances, 1) columns
+    """
+    db = substance_database()
+    rows = db.rows(substances)
+    if model == "antoine":
+        return [db.column(c, rows)[:, np.newaxis] for c in ("antoine_a", "antoine_b", "antoine_c")]
+    if model == "clausius-clapeyron":
+        dh_vap = db.column("h_vap", rows) * db.column("molar_mass", rows)  # J/mol
+        return [db.column("boiling_point", rows)[:, np.newaxis], dh_vap[:, np.newaxis]]
+    raise ValueError(f"unknown model '{model}', expected one of {VAPOR_PRESSURE_MODELS}")
+
+def _per_substance(values):
+    values = np.asarray(values, dtype=float)
+    return np.atleast_1d(values)[np.newaxis, :] if values.ndim <= 1 else values
+
+def antoine_range(substances):
+    """
+    Temperature range (K) each Antoine fit was made over, as (t_min, t_max)
+    """
+    db = substance_database()
+    rows = db.rows(substances)
+    return db.column("antoine_t_min", rows), db.column("antoine_t_max", rows)
+
+def _outside_antoine_range(substances, T):
+    t_min, t_max = antoine_range(substances)
+    return (
+        (T < t_min[:, np.newaxis] - ANTOINE_RANGE_TOLERANCE)
+        | (T > t_max[:, np.newaxis] + ANTOINE_RANGE_TOLERANCE)
     )
 
+def vapor_pressure(substances, T, model="antoine", derivative=False, extrapolate=False):
+    """
+    Vapor pressure (kPa) of every substance at every temperature.
+
+    "antoine" uses log10 P = A − B/(C + T) with the database coefficients
+    and gives NaN more than ANTOINE_RANGE_TOLERANCE outside each fit's
+    antoine_t_min..antoine_t_max unless extrapolate=True; "clausius-clapeyron" uses ln(P/P_ATM) =
+    −ΔH_vap/R·(1/T − 1/T_b) from the normal boiling point and molar heat of
+    vaporization. A 1-D T is shared by all substances, giving (substances,
+    len(T)); a 2-D T broadcasts against (substances, 1). Substances without
+    coefficients give NaN. With derivative=True, d(ln P)/dT (1/K) is
+    returned as well.
+    """
+    T = _per_substance(T)
+    coefficients = _vapor_pressure_coefficients(substances, model)
+
+    if model == "antoine":
+        a, b, c = coefficients
+        with np.errstate(divide="ignore"):
+            P = 10 ** (a - b / (c + T))
+        slope = np.log(10) * b / (c + T) ** 2
+        if not extrapolate:
+            outside = _outside_antoine_range(substances, T)
+            P = np.where(outside, np.nan, P)
+            slope = np.where(outside, np.nan, slope)
+    else:
+        T_b, dh_vap = coefficients
+        P = P_ATM * np.exp(-dh_vap / R * (1 / T - 1 / T_b))
+        slope = dh_vap / (R * T**2)
+
+    return (P, slope) if derivative else P
+
+def boiling_temperature(substances, P=P_ATM, model="antoine", extrapolate=False):
+    """
+    Temperature (K) at which each substance's vapor pressure equals P (kPa).
+
+    Closed-form inverse of vapor_pressure with the same shapes; NaN where
+    the model has no positive solution or, for "antoine" without
+    extrapolate, where the solution lies outside the fit range.
+    """
+    P = _per_substance(P)
+    coefficients = _vapor_pressure_coefficients(substances, model)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if model == "antoine":
+            a, b, c = coefficients
+            T = b / (a - np.log10(P)) - c
+        else:
+            T_b, dh_vap = coefficients
+            T = 1 / (1 / T_b - R * np.log(P / P_ATM) / dh_vap)
+
+    valid = T > 0
+    if model == "antoine" and not extrapolate:
+        valid &= ~_outside_antoine_range(substances, T)
+    return np.where(valid, T, np.nan)
+
+def generate_vapor_pressure_data(substance, T_min=None, T_max=None, model="antoine"):
+    """
+    Vapor pressure curve of one substance; the temperature range defaults to
+    the Antoine fit range (250–400 K for Clausius–Clapeyron) and points
+    outside the fit are NaN
+    """
+    if model == "antoine":
+        (t_min,), (t_max,) = antoine_range([substance])
+    else:
+        t_min, t_max = 250, 400
+    T = np.linspace(t_min if T_min is None else T_min, t_max if T_max is None else T_max, 50)
+    vp = vapor_pressure([substance], T, model)[0]
+
     return pd.DataFrame({
         "Temperature (K)": T,
         "Vapor Pressure (kPa)": vp
@@ -0,0 +1,167 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine.kinetics import R
+
+ORDERS = (0, 1, 2)
+
+def _linear_fit(x, y, mask):
+    """
+    Row-wise least-squares line y = a + b·x over the masked points
+    """
+    w = mask.astype(float)
+    n = w.sum(axis=1)
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+    sx, sy = (w * x).sum(axis=1), (w * y).sum(axis=1)
+    sxx, sxy = (w * x * x).sum(axis=1), (w * x * y).sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = (n * sxy - sx * sy) / (n * sxx - sx**2)
+        intercept = (sy - slope * sx) / n
+    return intercept, slope
+
+def order_model(order, A0, k, t):
+    """
+    Integrated rate law [A](t) for order 0, 1 or 2 (same forms as engine.kinetics)
+    """
+    if order == 0:
+        return np.maximum(A0 - k * t, 0)
+    if order == 1:
+        return A0 * np.exp(-k * t)
+    return 1 / (k * t + 1 / A0)
+
+def _order_jacobian(order, A0, k, t):
+    if order == 0:
+        running = A0 - k * t > 0
+        return np.where(running, 1.0, 0.0), np.where(running, -t, 0.0)
+    if order == 1:
+        decay = np.exp(-k * t)
+        return decay, -A0 * t * decay
+    conc = 1 / (k * t + 1 / A0)
+    return conc**2 / A0**2, -t * conc**2
+
+def _refine(order, A0, k, t, conc, mask, iterations=20):
+    """
+    Batched Levenberg–Marquardt on concentration residuals, started from the
+    linearized estimate
+    """
+    damping = np.full(A0.shape, 1e-3)
+
+    def sse(A0, k):
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            r = np.where(mask, order_model(order, A0[:, None], k[:, None], t) - conc, 0.0)
+        return np.sum(r**2, axis=1), r
+
+    current, residual = sse(A0, k)
+    for _ in range(iterations):
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            jA, jk = _order_jacobian(order, A0[:, None], k[:, None], t)
+        jA, jk = np.where(mask, jA, 0.0), np.where(mask, jk, 0.0)
+
+        aa = (jA * jA).sum(axis=1) * (1 + damping)
+        kk = (jk * jk).sum(axis=1) * (1 + damping)
+        ak = (jA * jk).sum(axis=1)
+        ga, gk = (jA * residual).sum(axis=1), (jk * residual).sum(axis=1)
+        det = aa * kk - ak**2
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            dA = -(kk * ga - ak * gk) / det
+            dk = -(aa * gk - ak * ga) / det
+        A0_new, k_new = A0 + dA, k + dk
+        trial, trial_residual = sse(A0_new, k_new)
+
+        better = np.isfinite(trial) & (trial < current) & (A0_new > 0)
+        A0 = np.where(better, A0_new, A0)
+        k = np.where(better, k_new, k)
+        current = np.where(better, trial, current)
+        residual = np.where(better[:, None], trial_residual, residual)
+        damping = np.where(better, damping * 0.3, damping * 10)
+
+    return A0, k, current
+
+def fit_rate_order(t, conc, refine=True):
+    """
+    Fit zeroth-, first- and second-order models to many concentration–time runs.
+
+    t is (points,) or (runs, points), conc is (runs, points); NaN marks missing
+    readings. Each order is first fitted on its linearized form ([A], ln[A],
+    1/[A] vs t) and then refined by nonlinear least squares on [A] itself, so
+    the orders are compared on the same residual. Returns a dict with per-order
+    "A0", "k" and "sse" arrays (runs, 3) and the best "order", "best_k".
+    """
+    conc = np.atleast_2d(np.asarray(conc, dtype=float))
+    t = np.broadcast_to(np.asarray(t, dtype=float), conc.shape)
+    valid = np.isfinite(t) & np.isfinite(conc)
+    positive = valid & (conc > 0)
+
+    runs = conc.shape[0]
+    A0 = np.empty((runs, 3))
+    k = np.empty((runs, 3))
+    sse = np.empty((runs, 3))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        linearized = (
+            (conc, valid, lambda a, b: (a, -b)),
+            (np.log(conc), positive, lambda a, b: (np.exp(a), -b)),
+            (1 / conc, positive, lambda a, b: (1 / a, b)),
+        )
+
+    for order, (y, mask, to_params) in zip(ORDERS, linearized):
+        intercept, slope = _linear_fit(t, y, mask)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            A0_o, k_o = to_params(intercept, slope)
+
+        if refine:
+            A0_o, k_o, sse_o = _refine(order, A0_o, k_o, t, conc, valid)
+        else:
+            with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+                r = np.where(valid, order_model(order, A0_o[:, None], k_o[:, None], t) - conc, 0.0)
+            sse_o = np.sum(r**2, axis=1)
+
+        A0[:, order], k[:, order], sse[:, order] = A0_o, k_o, sse_o
+
+    best = np.argmin(np.where(np.isfinite(sse), sse, np.inf), axis=1)
+    return {
+        "A0": A0,
+        "k": k,
+        "sse": sse,
+        "order": best,
+        "best_k": k[np.arange(runs), best],
+    }
+
+def fit_rate_order_parallel(t, conc, processes=None, chunk_size=2000, refine=True):
+    """
+    fit_rate_order over a process pool, chunk_size runs per task.
+    """
+    conc = np.atleast_2d(np.asarray(conc, dtype=float))
+    t = np.broadcast_to(np.asarray(t, dtype=float), conc.shape)
+    if conc.shape[0] <= chunk_size:
+        return fit_rate_order(t, conc, refine)
+
+    starts = range(0, conc.shape[0], chunk_size)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        parts = list(pool.map(
+            fit_rate_order,
+            [t[s:s + chunk_size] for s in starts],
+            [conc[s:s + chunk_size] for s in starts],
+            [refine] * len(starts),
+        ))
+
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+def fit_arrhenius(T, k):
+    """
+    A and Ea from rate constants at several temperatures, ln k = ln A − Ea/(R·T).
+
+    T and k are (temperatures,) or (datasets, temperatures); returns arrays
+    of A and Ea (J/mol), one per dataset.
+    """
+    k = np.atleast_2d(np.asarray(k, dtype=float))
+    T = np.broadcast_to(np.asarray(T, dtype=float), k.shape)
+    mask = np.isfinite(T) & np.isfinite(k) & (k > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        intercept, slope = _linear_fit(1 / T, np.log(k), mask)
+    return np.exp(intercept), -slope * R
@@ -1,6 +1,7 @@
 import numpy as np
 
 R = 8.314  # J/mol·K
+KB = 1.380649e-23  # J/K
 
 COMPOUNDS = {
     "Generic A": {"A": 1e7, "Ea": 50000, "order": "variable", "mass": 3.32e-26},
@@ -12,14 +13,80 @@ COMPOUNDS = {
     "Uranium-235 (Nuclear)": {"k": 0.00005, "order": "first", "mass": 3.91e-25, "Ea": 1e-20}
 }
 
+def compile_compounds(compounds):
+    """
+    Aligned arrays of the compound table for broadcast rate evaluation
+    """
+    names = list(compounds)
+    return {
+        "names": names,
+        "index": {name: i for i, name in enumerate(names)},
+        "A": np.array([compounds[n].get("A", np.nan) for n in names], dtype=float),
+        "Ea": np.array([compounds[n].get("Ea", np.nan) for n in names], dtype=float),
+        "k": np.array([compounds[n].get("k", np.nan) for n in names], dtype=float),
+        "mass": np.array([compounds[n].get("mass", np.nan) for n in names], dtype=float),
+        "is_nuclear": np.array(["Nuclear" in n for n in names]),
+    }
+
+# Compiled from COMPOUNDS; call recompile_compounds() after editing COMPOUNDS
+COMPOUND_TABLE = compile_compounds(COMPOUNDS)
+
+def recompile_compounds():
+    """
+    Rebuild COMPOUND_TABLE after COMPOUNDS has been edited
+    """
+    global COMPOUND_TABLE
+    COMPOUND_TABLE = compile_compounds(COMPOUNDS)
+    return COMPOUND_TABLE
+
+def _current_table(table):
+    return COMPOUND_TABLE if table is None else table
+
+def _compound_rows(compounds, table):
+    if compounds is None:
+        return np.arange(len(table["names"]))
+    return np.array([table["index"][c] for c in compounds], dtype=int)
+
+def _arrhenius_rows(idx, T, expand, table):
+    A = table["A"][idx][expand]
+    Ea = table["Ea"][idx][expand]
+    k = table["k"][idx][expand]
+    is_nuclear = table["is_nuclear"][idx][expand]
+
+    with np.errstate(invalid="ignore"):
+        rate = A * np.exp(-Ea / (R * T))
+
+    return np.where(is_nuclear, k, rate)
+
+def arrhenius_rate_matrix(T, compounds=None, table=None):
+    """
+    Rate constants for compounds × temperatures in one broadcast.
+
+    compounds is a list of names (default: the whole table); the result has
+    shape (len(compounds),) + np.shape(T). Nuclear entries return their
+    temperature-independent k. table defaults to COMPOUND_TABLE.
+    """
+    table = _current_table(table)
+    T = np.asarray(T, dtype=float)
+    expand = (slice(None),) + (np.newaxis,) * T.ndim
+    return _arrhenius_rows(_compound_rows(compounds, table), T, expand, table)
+
+def arrhenius_rate_paired(T, compounds=None, table=None):
+    """
+    Rate constants where the leading axis of T already runs over compounds,
+    e.g. a separate temperature grid per compound.
+    """
+    table = _current_table(table)
+    T = np.asarray(T, dtype=float)
+    expand = (slice(None),) + (np.newaxis,) * (T.ndim - 1)
+    return _arrhenius_rows(_compound_rows(compounds, table), T, expand, table)
+
 def arrhenius_rate(T, compound):
-    if "Nuclear" in compound:
-        return COMPOUNDS[compound]["k"]
-    else:
-        params = COMPOUNDS[compound]
-        A = params["A"]
-        Ea = params["Ea"]
-        return A * np.exp(-Ea / (R * T))
+    table = COMPOUND_TABLE
+    i = table["index"][compound]
+    if table["is_nuclear"][i]:
+        return table["k"][i]
+    return table["A"][i] * np.exp(-table["Ea"][i] / (R * T))
 
 def zeroth_order_concentration(A0, T, t, compound):
     k = arrhenius_rate(T, compound)
@@ -44,10 +111,29 @@ def second_order_half_life(A0, k):
     return 1 / (k * A0)
 
 def maxwell_boltzmann_distribution(T, mass, num_points=300):
-    kB = 1.380649e-23
+    kB = KB
     v_max = np.sqrt(10 * kB * T / mass)
     v = np.linspace(0, v_max, num_points)
     KE = 0.5 * mass * v**2
     f_v = 4*np.pi*(mass/(2*np.pi*kB*T))**1.5 * v**2 * np.exp(-mass*v**2/(2*kB*T))
     f_v /= np.max(f_v)
     return KE, f_v
+
+def reactive_fraction(T, Ea, mass=None, per_mole=False):
+    """
+    Fraction of molecules with kinetic energy >= Ea, in closed form.
+
+    The Maxwell–Boltzmann energy distribution gives the regularized upper
+    incomplete gamma function Q(3/2, x) with x = Ea/(kB·T), or Ea/(R·T) when
+    per_mole is True. The result does not depend on mass; it is accepted so
+    T, mass and Ea arrays broadcast together.
+    """
+    from scipy.special import gammaincc
+
+    T = np.asarray(T, dtype=float)
+    Ea = np.asarray(Ea, dtype=float)
+    x = Ea / ((R if per_mole else KB) * T)
+    if mass is not None:
+        x = x + np.zeros(np.shape(mass))
+
+    return gammaincc(1.5, np.maximum(x, 0))
@@ -0,0 +1,259 @@
+import re
+import numpy as np
+
+from engine.kinetics import R
+
+# Rosenbrock23 (Shampine & Reichelt, ode23s) constants
+GAMMA = 1 / (2 + np.sqrt(2))
+E32 = 6 + np.sqrt(2)
+
+def parse_equation(equation):
+    """
+    "2 A + B -> C" or "A <=> B" into (reactants, products, reversible)
+    """
+    reversible = "<=>" in equation
+    left, right = re.split(r"<=>|->", equation)
+
+    def side(text):
+        terms = {}
+        for term in text.split("+"):
+            term = term.strip()
+            if not term:
+                continue
+            match = re.match(r"^(\d*\.?\d*)\s*(.+)$", term)
+            coef = float(match.group(1)) if match.group(1) else 1.0
+            terms[match.group(2)] = terms.get(match.group(2), 0.0) + coef
+        return terms
+
+    return side(left), side(right), reversible
+
+def _rate_constant(step, T, suffix=""):
+    if "k" + suffix in step:
+        return step["k" + suffix]
+    if T is None:
+        raise ValueError(f"step '{step['equation']}' uses Arrhenius parameters but no T was given")
+    return step["A" + suffix] * np.exp(-step["Ea" + suffix] / (R * T))
+
+def compile_mechanism(steps, T=None):
+    """
+    Mass-action mechanism from a list of step dicts.
+
+    Each step has an "equation" ("A + B -> C", "A <=> B") and either "k" or
+    Arrhenius "A"/"Ea" (evaluated at T). Reversible steps also need "k_reverse"
+    or "A_reverse"/"Ea_reverse". Returns stoichiometry, rate constants and the
+    index arrays used to evaluate rates and the sparse Jacobian.
+    """
+    species = []
+    index = {}
+    forward = []
+
+    for step in steps:
+        reactants, products, reversible = parse_equation(step["equation"])
+        for name in list(reactants) + list(products):
+            if name not in index:
+                index[name] = len(species)
+                species.append(name)
+
+        forward.append((reactants, products, _rate_constant(step, T)))
+        if reversible:
+            forward.append((products, reactants, _rate_constant(step, T, "_reverse")))
+
+    n_steps, n_species = len(forward), len(species)
+    nu_reactant = np.zeros((n_steps, n_species))
+    nu_product = np.zeros((n_steps, n_species))
+    k = np.empty(n_steps)
+
+    for j, (reactants, products, k_j) in enumerate(forward):
+        for name, coef in reactants.items():
+            nu_reactant[j, index[name]] = coef
+        for name, coef in products.items():
+            nu_product[j, index[name]] = coef
+        k[j] = k_j
+
+    nu = nu_product - nu_reactant
+
+    # Reactant (step, species) pairs, sorted by step
+    pair_step, pair_species = np.nonzero(nu_reactant)
+    pair_order = nu_reactant[pair_step, pair_species]
+
+    # For every pair, the other pairs of the same step (padded with a dummy
+    # column of ones) so dr_j/dc_m needs no division by c_m
+    n_pairs = pair_step.size
+    siblings = [np.flatnonzero((pair_step == pair_step[p]) & (np.arange(n_pairs) != p)) for p in range(n_pairs)]
+    width = max([len(s) for s in siblings], default=0)
+    sibling_index = np.full((n_pairs, max(width, 1)), n_pairs)
+    for p, s in enumerate(siblings):
+        sibling_index[p, :len(s)] = s
+
+    # Jacobian contributions J[i, m] += nu[j, i] * dr_j/dc_m, grouped by target
+    contrib_pair, contrib_species = np.nonzero(nu[pair_step])
+    contrib_coef = nu[pair_step[contrib_pair], contrib_species]
+    target = contrib_species * n_species + pair_species[contrib_pair]
+    order = np.argsort(target, kind="stable")
+    target_unique, target_start = np.unique(target[order], return_index=True)
+
+    return {
+        "species": species,
+        "index": index,
+        "k": k,
+        "nu": nu,
+        "pair_step": pair_step,
+        "pair_species": pair_species,
+        "pair_order": pair_order,
+        "sibling_index": sibling_index,
+        "steps_with_reactants": np.unique(pair_step),
+        "step_start": np.searchsorted(pair_step, np.unique(pair_step)),
+        "jac_pair": contrib_pair[order],
+        "jac_coef": contrib_coef[order],
+        "jac_target": target_unique,
+        "jac_start": target_start,
+    }
+
+def step_rates(mechanism, conc):
+    """
+    Rate of every (irreversible) step for a batch of concentrations (B, S)
+    """
+    conc = np.atleast_2d(conc)
+    rates = np.broadcast_to(mechanism["k"], (conc.shape[0], mechanism["k"].size)).copy()
+    if mechanism["pair_step"].size:
+        factors = conc[:, mechanism["pair_species"]] ** mechanism["pair_order"]
+        rates[:, mechanism["steps_with_reactants"]] *= np.multiply.reduceat(
+            factors, mechanism["step_start"], axis=1
+        )
+    return rates
+
+def mechanism_rates(mechanism, conc):
+    """
+    dC/dt for a batch of concentrations (B, S)
+    """
+    return step_rates(mechanism, conc) @ mechanism["nu"]
+
+def _jacobian_values(mechanism, conc):
+    """
+    Jacobian nonzeros for a batch (B, S), shape (B, T) in jac_target order
+    """
+    conc = np.atleast_2d(conc)
+    if not mechanism["pair_step"].size:
+        return np.zeros((conc.shape[0], 0))
+
+    order = mechanism["pair_order"]
+    base = conc[:, mechanism["pair_species"]]
+    factors = np.concatenate([base ** order, np.ones((conc.shape[0], 1))], axis=1)
+    d_rate = (
+        mechanism["k"][mechanism["pair_step"]]
+        * order * base ** (order - 1)
+        * np.prod(factors[:, mechanism["sibling_index"]], axis=-1)
+    )
+    values = d_rate[:, mechanism["jac_pair"]] * mechanism["jac_coef"]
+    return np.add.reduceat(values, mechanism["jac_start"], axis=1)
+
+def mechanism_jacobian(mechanism, conc):
+    """
+    Analytic Jacobian d(dC/dt)/dC, shape (B, S, S), assembled from the
+    stoichiometric nonzeros only
+    """
+    conc = np.atleast_2d(conc)
+    batch, n_species = conc.shape
+    jac = np.zeros((batch, n_species * n_species))
+    jac[:, mechanism["jac_target"]] = _jacobian_values(mechanism, conc)
+    return jac.reshape(batch, n_species, n_species)
+
+def initial_state(mechanism, initial):
+    """
+    (B, S) array from a dict {species: value or array}; missing species are 0
+    """
+    if not isinstance(initial, dict):
+        return np.atleast_2d(np.asarray(initial, dtype=float))
+
+    values = {name: np.atleast_1d(np.asarray(v, dtype=float)) for name, v in initial.items()}
+    batch = max(v.size for v in values.values())
+    conc = np.zeros((batch, len(mechanism["species"])))
+    for name, v in values.items():
+        conc[:, mechanism["index"][name]] = v
+    return conc
+
+def integrate_mechanism(
+    mechanism,
+    initial,
+    t_eval,
+    rtol=1e-6,
+    atol=1e-12,
+    max_steps=100000
+):
+    """
+    Integrate a batch of initial conditions with a Rosenbrock23 stiff solver.
+
+    All members share one adaptive step size (the error norm is the worst
+    member's), and the step is clipped to land on every t_eval point.
+    W = I − γhJ is kept sparse: the whole batch is one block-diagonal matrix
+    with the identity and the mechanism's Jacobian nonzeros, factorized with
+    a sparse LU, so the cost per step follows the nonzeros and LU fill rather
+    than the O(B·S³) of a dense inverse. The Jacobian is evaluated once per
+    accepted state and reused by rejected attempts, which only refactorize.
+    Returns concentrations of shape (B, len(t_eval), S).
+    """
+    from scipy.sparse import csc_matrix
+    from scipy.sparse.linalg import splu
+
+    conc = initial_state(mechanism, initial)
+    t_eval = np.asarray(t_eval, dtype=float)
+    batch, n_species = conc.shape
+    size = batch * n_species
+
+    # Block-diagonal pattern of W: each member's identity diagonal, then its
+    # Jacobian nonzeros (duplicates on the diagonal are summed)
+    offsets = (np.arange(batch) * n_species)[:, np.newaxis]
+    diagonal = np.arange(n_species)
+    target = mechanism["jac_target"]
+    rows = np.concatenate([offsets + diagonal, offsets + target // n_species], axis=1).ravel()
+    cols = np.concatenate([offsets + diagonal, offsets + target % n_species], axis=1).ravel()
+    ones = np.ones((batch, n_species))
+
+    out = np.empty((batch, t_eval.size, n_species))
+    t = t_eval[0]
+    out[:, 0] = conc
+
+    f0 = mechanism_rates(mechanism, conc)
+    scale = atol + rtol * np.abs(conc)
+    rate_norm = np.max(np.sqrt(np.mean((f0 / scale) ** 2, axis=1)))
+    span = t_eval[-1] - t_eval[0]
+    h = span * 1e-6 if rate_norm == 0 else min(span, 0.01 / rate_norm)
+
+    jac = None
+    n_steps = 0
+    for i in range(1, t_eval.size):
+        while t < t_eval[i]:
+            if n_steps >= max_steps:
+                raise RuntimeError(f"integrate_mechanism exceeded max_steps={max_steps}")
+            n_steps += 1
+
+            if jac is None:
+                jac = _jacobian_values(mechanism, conc)
+            h_step = min(h, t_eval[i] - t)
+            data = np.concatenate([ones, -h_step * GAMMA * jac], axis=1).ravel()
+            lu = splu(csc_matrix((data, (rows, cols)), shape=(size, size)))
+
+            def solve(rhs):
+                return lu.solve(rhs.ravel()).reshape(batch, n_species)
+
+            k1 = solve(f0)
+            f1 = mechanism_rates(mechanism, conc + 0.5 * h_step * k1)
+            k2 = solve(f1 - k1) + k1
+            conc_new = conc + h_step * k2
+            f2 = mechanism_rates(mechanism, conc_new)
+            k3 = solve(f2 - E32 * (k2 - f1) - 2 * (k1 - f0))
+
+            scale = atol + rtol * np.maximum(np.abs(conc), np.abs(conc_new))
+            error = h_step / 6 * (k1 - 2 * k2 + k3) / scale
+            error_norm = np.max(np.sqrt(np.mean(error**2, axis=1)))
+
+            if error_norm <= 1:
+                t = t_eval[i] if h_step == t_eval[i] - t else t + h_step
+                conc, f0 = conc_new, f2
+                jac = None
+            factor = 5.0 if error_norm == 0 else min(5.0, max(0.2, 0.9 * error_norm ** (-1 / 3)))
+            h = h_step * factor
+
+        out[:, i] = conc
+
+    return out
@@ -0,0 +1,118 @@
+import numpy as np
+
+from engine.kinetics import R, arrhenius_rate_paired
+from engine.thermodynamics import gibbs_energy
+from engine.reactors import reactor_conversion
+
+GOLDEN = (np.sqrt(5) - 1) / 2
+
+def _evaluate(T, compounds, settings):
+    """
+    Objective (−inf where a constraint fails) plus the quantities behind it;
+    T has one row per compound
+    """
+    k = arrhenius_rate_paired(T, compounds)
+    feasible = np.isfinite(k)
+    objective = k.copy()
+    delta_g = np.full(T.shape, np.nan)
+
+    if settings["delta_h_kj"] is not None:
+        delta_g, spontaneous = gibbs_energy(settings["delta_h_kj"], settings["delta_s_j"], T)
+        if settings["require_spontaneous"]:
+            feasible &= spontaneous
+        if settings["objective"] == "net_rate":
+            # Forward rate scaled by the distance from equilibrium, 1 − 1/K
+            objective = k * (1 - np.exp(delta_g * 1000 / (R * T)))
+
+    conversion = reactor_conversion(
+        settings["reactor"], settings["order"], k, settings["tau"], settings["C0"]
+    )
+    if settings["min_conversion"] is not None:
+        feasible &= conversion >= settings["min_conversion"]
+
+    return np.where(feasible, objective, -np.inf), k, conversion, delta_g
+
+def optimal_temperature(
+    compounds,
+    delta_h_kj=None,
+    delta_s_j=None,
+    T_min=250,
+    T_max=2000,
+    min_conversion=None,
+    reactor="PFR",
+    order=1,
+    tau=1.0,
+    C0=1.0,
+    objective="rate",
+    require_spontaneous=True,
+    grid_points=512,
+    tol=1e-3
+):
+    """
+    Operating temperature that maximizes the rate for each compound.
+
+    objective "rate" maximizes k(T) from arrhenius_rate; "net_rate" maximizes
+    k(T)·(1 − 1/K(T)), which has an interior optimum for exothermic
+    reversible reactions. Constraints: T_min <= T <= T_max, reactor
+    conversion >= min_conversion and, with delta_h_kj/delta_s_j given, ΔG < 0
+    from gibbs_energy. All compounds are scanned on a shared coarse grid in
+    one array pass, then each optimum is refined by golden-section search
+    inside the bracket around its best grid point. T_opt is NaN where no
+    temperature is feasible.
+    """
+    if objective not in ("rate", "net_rate"):
+        raise ValueError(f"unknown objective '{objective}', expected 'rate' or 'net_rate'")
+
+    compounds = list(compounds)
+    settings = {
+        "delta_h_kj": delta_h_kj,
+        "delta_s_j": delta_s_j,
+        "require_spontaneous": require_spontaneous,
+        "objective": objective,
+        "reactor": reactor,
+        "order": order,
+        "tau": tau,
+        "C0": C0,
+        "min_conversion": min_conversion,
+    }
+    rows = np.arange(len(compounds))
+
+    grid = np.linspace(T_min, T_max, grid_points)
+    values = _evaluate(np.tile(grid, (len(compounds), 1)), compounds, settings)[0]
+    best = np.argmax(values, axis=1)
+    best_T = grid[best]
+    best_value = values[rows, best]
+
+    lo = grid[np.maximum(best - 1, 0)]
+    hi = grid[np.minimum(best + 1, grid_points - 1)]
+    c = hi - GOLDEN * (hi - lo)
+    d = lo + GOLDEN * (hi - lo)
+
+    while np.max(hi - lo) > tol:
+        f = _evaluate(np.stack([c, d], axis=1), compounds, settings)[0]
+        left = f[:, 0] >= f[:, 1]
+        hi = np.where(left, d, hi)
+        lo = np.where(left, lo, c)
+
+        # Keep the best point actually evaluated, so a constraint edge is never crossed
+        for i in (0, 1):
+            point = c if i == 0 else d
+            better = f[:, i] > best_value
+            best_T = np.where(better, point, best_T)
+            best_value = np.where(better, f[:, i], best_value)
+
+        c = hi - GOLDEN * (hi - lo)
+        d = lo + GOLDEN * (hi - lo)
+
+    feasible = np.isfinite(best_value)
+    T_opt = np.where(feasible, best_T, np.nan)
+    _, k, conversion, delta_g = _evaluate(best_T[:, np.newaxis], compounds, settings)
+
+    return {
+        "compound": compounds,
+        "T_opt": T_opt,
+        "k": np.where(feasible, k[:, 0], np.nan),
+        "conversion": np.where(feasible, conversion[:, 0], np.nan),
+        "delta_g_kj": np.where(feasible, delta_g[:, 0], np.nan),
+        "feasible": feasible,
+    }
@@ -1,58 +1,90 @@
 import math
+import numpy as np
 import pandas as pd
 
+from engine.database import SubstanceView, element_table, substance_database
+
 R = 8.314  # J/mol*K
+PHASES = ("Solid", "Liquid", "Gas")  # phase codes 0, 1, 2
+UNKNOWN_PHASE = -1
 
-SUBSTANCES = {
-    "H2O": {
-        "molar_mass": 18.02,
-        "polarity": "Polar",
-        "imf": "Hydrogen Bonding",
-        "bp": 373,
-        "mp": 273,
-        "en_diff": 1.4
-    },
-    "NH3": {
-        "molar_mass": 17.03,
-        "polarity": "Polar",
-        "imf": "Hydrogen Bonding",
-        "bp": 240,
-        "mp": 195,
-        "en_diff": 0.9
-    },
-    "CH4": {
-        "molar_mass": 16.04,
-        "polarity": "Nonpolar",
-        "imf": "London Dispersion Forces",
-        "bp": 112,
-        "mp": 91,
-        "en_diff": 0.4
+SUBSTANCES = SubstanceView(
+    {
+        "molar_mass": "molar_mass",
+        "polarity": "polarity",
+        "imf": "imf",
+        "bp": "boiling_point",
+        "mp": "melting_point",
+        "en_diff": "en_diff",
     },
-    "CO2": {
-        "molar_mass": 44.01,
-        "polarity": "Nonpolar",
-        "imf": "London Dispersion Forces",
-        "bp": 194,
-        "mp": 216,
-        "en_diff": 0.9
-    },
-    "NaCl": {
-        "molar_mass": 58.44,
-        "polarity": "Ionic",
-        "imf": "Ionic Forces",
-        "bp": 1738,
-        "mp": 1074,
-        "en_diff": 2.1
-    }
+    require="polarity"
+)
+
+# Legacy column labels of the periodic-trend table
+TREND_COLUMNS = {
+    "Element": "symbol",
+    "Atomic Number": "atomic_number",
+    "Atomic Radius (pm)": "atomic_radius",
+    "Electronegativity": "electronegativity",
+    "Ionization Energy (kJ/mol)": "ionization_energy",
 }
 
-PERIODIC_TRENDS = pd.DataFrame({
-    "Element": ["Li", "C", "N", "O", "F"],
-    "Atomic Number": [3, 6, 7, 8, 9],
-    "Atomic Radius (pm)": [152, 77, 75, 73, 71],
-    "Electronegativity": [0.98, 2.55, 3.04, 3.44, 3.98],
-    "Ionization Energy (kJ/mol)": [520, 1086, 1402, 1314, 1681]
-})
+def __getattr__(name):
+    # PERIODIC_TRENDS is built from the element table on first access
+    if name == "PERIODIC_TRENDS":
+        global PERIODIC_TRENDS
+        PERIODIC_TRENDS = periodic_trends()
+        return PERIODIC_TRENDS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def element_rows(elements=None, period=None, group=None, block=None):
+    """
+    Row indices into the element table, optionally restricted to given
+    symbols/names/atomic numbers and filtered by period, group and block
+    (each a value or a list of values)
+    """
+    table = element_table()
+    rows = table.rows(elements)
+    for column, wanted in (("period", period), ("group", group), ("block", block)):
+        if wanted is not None:
+            values = table.column(column, rows)
+            rows = rows[np.isin(values, np.atleast_1d(wanted))]
+    return rows
+
+def element_property(name, rows=None):
+    """
+    One element-table column as an array (NaN where unknown) for the given rows
+    """
+    return element_table().column(TREND_COLUMNS.get(name, name), rows)
+
+def periodic_trends(rows=None):
+    """
+    Periodic-trend DataFrame with the legacy column labels
+    """
+    return pd.DataFrame({label: element_property(column, rows) for label, column in TREND_COLUMNS.items()})
+
+def trend_slopes(name, by="period", rows=None):
+    """
+    Least-squares slope of a property against atomic number within each
+    period (or group), over the given rows; elements with missing values
+    are skipped. Returns {by: keys, "slope": ..., "count": ...}.
+    """
+    table = element_table()
+    rows = table.rows(None) if rows is None else np.asarray(rows)
+    x = table.column("atomic_number", rows)
+    y = element_property(name, rows)
+    key = table.column(by, rows)
+    valid = ~(np.isnan(y) | np.isnan(key))
+
+    keys, bins = np.unique(key[valid], return_inverse=True)
+    x, y = x[valid], y[valid]
+    n = np.bincount(bins)
+    sx, sy = np.bincount(bins, x), np.bincount(bins, y)
+    sxx, sxy = np.bincount(bins, x * x), np.bincount(bins, x * y)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = (n * sxy - sx * sy) / (n * sxx - sx**2)
+    return {by: keys.astype(int), "slope": slope, "count": n}
 
 def get_substance_data(name):
     if name in SUBSTANCES:
@@ -63,12 +95,73 @@ def predict_phase(substance, temperature):
     if substance is None:
         return "Unknown"
 
-    if temperature < substance["mp"]:
-        return "Solid"
-    elif substance["mp"] <= temperature < substance["bp"]:
-        return "Liquid"
-    else:
-        return "Gas"
+    code = phase_codes_from_points([substance["mp"]], [substance["bp"]], [temperature], paired=True)[0]
+    return phase_name(code)
+
+def phase_name(code):
+    """
+    Name of a phase code, "Unknown" for UNKNOWN_PHASE
+    """
+    return "Unknown" if code == UNKNOWN_PHASE else PHASES[code]
+
+def phase_codes_from_points(mp, bp, T, paired=False):
+    """
+    Integer phase codes (see PHASES) from melting and boiling points.
+
+    Solid below mp, liquid in [mp, bp), gas from bp; a substance that
+    sublimes (bp < mp) goes straight from solid to gas at bp. With
+    paired=False the result is (substances, len(T)): T is sorted once and
+    each substance's two transition points are located with searchsorted,
+    so the fill is a pair of integer comparisons per cell. With paired=True
+    mp, bp and T are aligned and the result has their broadcast shape.
+    Missing points (NaN) give UNKNOWN_PHASE.
+    """
+    bp = np.asarray(bp, dtype=float)
+    mp = np.minimum(np.asarray(mp, dtype=float), bp)
+    T = np.asarray(T, dtype=float)
+    unknown = np.isnan(mp) | np.isnan(bp)
+
+    if paired:
+        codes = (T >= mp).astype(np.int8) + (T >= bp)
+        return np.where(unknown, UNKNOWN_PHASE, codes).astype(np.int8)
+
+    T = T.ravel()
+    order = np.argsort(T, kind="stable")
+    melt = np.searchsorted(T[order], mp, side="left")[:, np.newaxis]
+    boil = np.searchsorted(T[order], bp, side="left")[:, np.newaxis]
+
+    rank = np.empty(T.size, dtype=np.intp)
+    rank[order] = np.arange(T.size)
+    codes = (rank >= melt).astype(np.int8) + (rank >= boil)
+    codes[unknown] = UNKNOWN_PHASE
+    return codes.astype(np.int8)
+
+def _substance_rows(substances):
+    db = substance_database()
+    if substances is None:
+        return db.rows(None)
+    if np.issubdtype(np.asarray(substances).dtype, np.integer):
+        return np.asarray(substances)
+    return db.rows(substances)
+
+def phase_codes(substances, T, paired=False):
+    """
+    Phase codes for database substances: names/formulas or row indices
+    (None for the whole database). See phase_codes_from_points.
+    """
+    db = substance_database()
+    rows = _substance_rows(substances)
+    return phase_codes_from_points(db.column("melting_point", rows), db.column("boiling_point", rows), T, paired)
+
+def phase_map(substances, T):
+    """
+    Substances × temperatures DataFrame of phase names, indexed by formula
+    """
+    rows = _substance_rows(substances)
+    codes = phase_codes(rows, T)
+    labels = np.array(PHASES + ("Unknown",))[codes]  # code −1 picks "Unknown"
+    index = substance_database().column("formula", rows)
+    return pd.DataFrame(labels, index=list(index), columns=np.asarray(T))
 
 def average_kinetic_energy(temperature):
     return (3/2) * R * temperature
@@ -0,0 +1,110 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine.kinetics import arrhenius_rate_matrix
+
+REACTORS = ("Batch", "CSTR", "PFR")
+
+def reactor_conversion(reactor, order, k, tau, C0):
+    """
+    Conversion of A for rate = k[A]^order in an ideal isothermal reactor.
+
+    reactor is "Batch", "CSTR" or "PFR"; tau is the batch time or the
+    residence time. Batch and PFR share the integrated rate laws of
+    engine.kinetics; the CSTR uses the steady-state design equation
+    tau = C0·X / (k·(C0·(1 − X))^order). k, tau and C0 broadcast.
+    """
+    k = np.asarray(k, dtype=float)
+    tau = np.asarray(tau, dtype=float)
+    C0 = np.asarray(C0, dtype=float)
+
+    if reactor not in REACTORS:
+        raise ValueError(f"unknown reactor '{reactor}', expected one of {REACTORS}")
+
+    if order == 0:
+        return np.minimum(k * tau / C0, 1.0)
+
+    if order == 1:
+        Da = k * tau
+        if reactor == "CSTR":
+            return Da / (1 + Da)
+        return 1 - np.exp(-Da)
+
+    if order == 2:
+        Da = k * tau * C0
+        if reactor == "CSTR":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                X = (2 * Da + 1 - np.sqrt(4 * Da + 1)) / (2 * Da)
+            return np.where(Da > 0, X, 0.0)
+        return Da / (1 + Da)
+
+    raise ValueError(f"unsupported order {order}, expected 0, 1 or 2")
+
+def conversion_sweep(compound, reactor, order, tau, T, C0):
+    """
+    Conversion over a residence time × temperature × feed concentration grid.
+
+    Rate constants come from arrhenius_rate for the given compound. Returns
+    columnar arrays (one entry per grid point, tau varying slowest).
+    """
+    tau = np.atleast_1d(np.asarray(tau, dtype=float))
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    C0 = np.atleast_1d(np.asarray(C0, dtype=float))
+
+    k = arrhenius_rate_matrix(T, [compound])[0]
+    X = reactor_conversion(
+        reactor,
+        order,
+        k[np.newaxis, :, np.newaxis],
+        tau[:, np.newaxis, np.newaxis],
+        C0[np.newaxis, np.newaxis, :]
+    )
+
+    # First-order conversion does not depend on C0, so expand X to the full grid
+    tau_grid, T_grid, C0_grid = np.meshgrid(tau, T, C0, indexing="ij")
+    X = np.broadcast_to(X, tau_grid.shape)
+    k_grid = np.broadcast_to(k[np.newaxis, :, np.newaxis], tau_grid.shape)
+
+    columns = {
+        "tau": tau_grid.ravel(),
+        "T": T_grid.ravel(),
+        "C0": C0_grid.ravel(),
+        "k": k_grid.ravel(),
+        "conversion": X.ravel(),
+        "outlet_concentration": (C0_grid * (1 - X)).ravel(),
+    }
+    if len({v.size for v in columns.values()}) != 1:
+        raise ValueError("conversion_sweep columns do not line up")
+    return columns
+
+def conversion_sweep_parallel(
+    compound,
+    reactor,
+    order,
+    tau,
+    T,
+    C0,
+    processes=None,
+    chunk_size=64
+):
+    """
+    conversion_sweep with the residence-time axis split across a process pool.
+    """
+    tau = np.atleast_1d(np.asarray(tau, dtype=float))
+    if tau.size <= chunk_size:
+        return conversion_sweep(compound, reactor, order, tau, T, C0)
+
+    chunks = [tau[s:s + chunk_size] for s in range(0, tau.size, chunk_size)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        parts = list(pool.map(
+            conversion_sweep,
+            [compound] * len(chunks),
+            [reactor] * len(chunks),
+            [order] * len(chunks),
+            chunks,
+            [T] * len(chunks),
+            [C0] * len(chunks),
+        ))
+
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
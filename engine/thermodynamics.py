@@ -1,22 +1,34 @@
 import numpy as np
 
+from engine.database import SubstanceView, cached_on_database, parse_formula, substance_database
+
 R = 8.314  # J/mol·K
 
-SPECIES = {
-    "None": {"Hf": 0},
-    "Hydrogen (H2)": {"Hf": 0},
-    "Oxygen (O2)": {"Hf": 0},
-    "Water (H2O)": {"Hf": -286000},
-    "Carbon Dioxide (CO2)": {"Hf": -394000},
-    "Methane (CH4)": {"Hf": -75000},
-    "Ammonia (NH3)": {"Hf": -46000},
-}
-HEAT_CAPACITY = {
-    "Water (H2O)": 4.18,
-    "Methane (CH4)": 2.22,
-    "Ammonia (NH3)": 4.7,
-    "Carbon Dioxide (CO2)": 0.84,
-}
+# Species, heat capacities (J/(g·K)) and 1 atm phase-change data (K, J/(g·K),
+# J/g) are views of the substance database keyed by "Name (formula)". CO2
+# sublimes: its boiling point is below its (triple-point) melting point and
+# h_vap is ΔH_sub.
+SPECIES = SubstanceView(
+    {"Hf": "hf", "elements": ("formula", parse_formula)},
+    key="label",
+    require="hf",
+    extra={"None": {"Hf": 0, "elements": {}}}
+)
+HEAT_CAPACITY = SubstanceView("heat_capacity", key="label", require="heat_capacity")
+PHASE_DATA = SubstanceView(
+    {
+        "mp": "melting_point",
+        "bp": "boiling_point",
+        "cp_solid": "cp_solid",
+        "cp_liquid": "cp_liquid",
+        "cp_gas": "cp_gas",
+        "h_fus": "h_fus",
+        "h_vap": "h_vap",
+    },
+    key="label",
+    require="h_vap"
+)
+
 def reaction_enthalpy(reactants, products):
     """
     ΔH = ΣH(products) − ΣH(reactants)
@@ -25,6 +37,158 @@ def reaction_enthalpy(reactants, products):
     H_prod = sum(SPECIES[p]["Hf"] for p in products if p != "None")
     return H_prod - H_react
 
+@cached_on_database
+def formation_table():
+    """
+    (species index, ΔHf vector) over SPECIES, compiled once per database
+    """
+    index = {name: i for i, name in enumerate(SPECIES)}
+    hf = np.array([SPECIES[name]["Hf"] for name in index], dtype=float)
+    return index, hf
+
+def stoichiometric_matrix(reactions, index=None):
+    """
+    Sparse (COO) reactions × species matrix of signed coefficients.
+
+    Each reaction is a dict {species: coefficient}, negative for reactants and
+    positive for products, e.g. {"Methane (CH4)": -1, "Oxygen (O2)": -2,
+    "Carbon Dioxide (CO2)": 1, "Water (H2O)": 2}. "None" entries are ignored.
+    """
+    if index is None:
+        index = formation_table()[0]
+
+    unknown = sorted({s for r in reactions for s in r if s != "None" and s not in index})
+    if unknown:
+        raise ValueError(f"unknown species: {', '.join(unknown)}")
+
+    entries = [
+        (i, index[s], coef)
+        for i, r in enumerate(reactions)
+        for s, coef in r.items()
+        if s != "None" and coef != 0
+    ]
+    rows, cols, coefs = zip(*entries) if entries else ((), (), ())
+
+    return {
+        "rows": np.array(rows, dtype=int),
+        "cols": np.array(cols, dtype=int),
+        "coef": np.array(coefs, dtype=float),
+        "shape": (len(reactions), len(index)),
+    }
+
+def reaction_enthalpies(reactions, hf=None):
+    """
+    ΔH (J/mol) of every reaction as one sparse matrix–vector product ν·ΔHf.
+
+    reactions is a list of signed-coefficient dicts or a matrix from
+    stoichiometric_matrix.
+    """
+    if hf is None:
+        hf = formation_table()[1]
+    if not isinstance(reactions, dict):
+        reactions = stoichiometric_matrix(reactions)
+
+    return np.bincount(
+        reactions["rows"],
+        weights=reactions["coef"] * hf[reactions["cols"]],
+        minlength=reactions["shape"][0]
+    )
+
+# NASA 7-coefficient ideal-gas polynomials (GRI-Mech 3.0), [low, high] ranges
+# split at NASA_T_MID: Cp/R = a1 + a2·T + a3·T² + a4·T³ + a5·T⁴,
+# a6 and a7 are the enthalpy and entropy integration constants
+NASA_T_MID = 1000.0  # K
+NASA_POLYNOMIALS = {
+    "Hydrogen (H2)": [
+        [2.34433112e+00, 7.98052075e-03, -1.94781510e-05, 2.01572094e-08, -7.37611761e-12, -9.17935173e+02, 6.83010238e-01],
+        [3.33727920e+00, -4.94024731e-05, 4.99456778e-07, -1.79566394e-10, 2.00255376e-14, -9.50158922e+02, -3.20502331e+00],
+    ],
+    "Oxygen (O2)": [
+        [3.78245636e+00, -2.99673416e-03, 9.84730201e-06, -9.68129509e-09, 3.24372837e-12, -1.06394356e+03, 3.65767573e+00],
+        [3.28253784e+00, 1.48308754e-03, -7.57966669e-07, 2.09470555e-10, -2.16717794e-14, -1.08845772e+03, 5.45323129e+00],
+    ],
+    "Nitrogen (N2)": [
+        [3.29867700e+00, 1.40824040e-03, -3.96322200e-06, 5.64151500e-09, -2.44485400e-12, -1.02089990e+03, 3.95037200e+00],
+        [2.92664000e+00, 1.48797680e-03, -5.68476000e-07, 1.00970380e-10, -6.75335100e-15, -9.22797700e+02, 5.98052800e+00],
+    ],
+    "Water (H2O)": [
+        [4.19864056e+00, -2.03643410e-03, 6.52040211e-06, -5.48797062e-09, 1.77197817e-12, -3.02937267e+04, -8.49032208e-01],
+        [3.03399249e+00, 2.17691804e-03, -1.64072518e-07, -9.70419870e-11, 1.68200992e-14, -3.00042971e+04, 4.96677010e+00],
+    ],
+    "Carbon Monoxide (CO)": [
+        [3.57953347e+00, -6.10353680e-04, 1.01681433e-06, 9.07005884e-10, -9.04424499e-13, -1.43440860e+04, 3.50840928e+00],
+        [2.71518561e+00, 2.06252743e-03, -9.98825771e-07, 2.30053008e-10, -2.03647716e-14, -1.41518724e+04, 7.81868772e+00],
+    ],
+    "Carbon Dioxide (CO2)": [
+        [2.35677352e+00, 8.98459677e-03, -7.12356269e-06, 2.45919022e-09, -1.43699548e-13, -4.83719697e+04, 9.90105222e+00],
+        [3.85746029e+00, 4.41437026e-03, -2.21481404e-06, 5.23490188e-10, -4.72084164e-14, -4.87591660e+04, 2.27163806e+00],
+    ],
+    "Methane (CH4)": [
+        [5.14987613e+00, -1.36709788e-02, 4.91800599e-05, -4.84743026e-08, 1.66693956e-11, -1.02466476e+04, -4.64130376e+00],
+        [7.48514950e-02, 1.33909467e-02, -5.73285809e-06, 1.22292535e-09, -1.01815230e-13, -9.46834459e+03, 1.84373180e+01],
+    ],
+    "Ammonia (NH3)": [
+        [4.28602740e+00, -4.66052300e-03, 2.17185130e-05, -2.28088870e-08, 8.26380460e-12, -6.74172850e+03, -6.25372770e-01],
+        [2.63445210e+00, 5.66625600e-03, -1.72786760e-06, 2.38671610e-10, -1.25787860e-14, -6.54469580e+03, 6.56629280e+00],
+    ],
+}
+NASA_SPECIES = list(NASA_POLYNOMIALS)
+NASA_INDEX = {name: i for i, name in enumerate(NASA_SPECIES)}
+NASA_COEFFS = np.array([NASA_POLYNOMIALS[name] for name in NASA_SPECIES])  # (species, 2, 7)
+
+def _nasa_rows(species):
+    if species is None:
+        return np.arange(len(NASA_SPECIES))
+
+    missing = [s for s in species if s not in NASA_POLYNOMIALS]
+    if missing:
+        raise ValueError(f"no heat-capacity polynomial for: {', '.join(missing)}")
+    return np.array([NASA_INDEX[s] for s in species], dtype=int)
+
+def nasa_properties(T, species=None):
+    """
+    Ideal-gas Cp (J/mol·K), H (J/mol) and S° (J/mol·K) for species × temperatures.
+
+    species defaults to every entry of NASA_POLYNOMIALS; each result has shape
+    (len(species),) + np.shape(T). H includes the formation enthalpy, so
+    H(298.15 K) is ΔHf of the gas.
+    """
+    T = np.asarray(T, dtype=float)
+    coeffs = NASA_COEFFS[_nasa_rows(species)]
+    expand = (slice(None),) + (np.newaxis,) * T.ndim
+    high = T >= NASA_T_MID
+
+    a = [np.where(high, coeffs[:, 1, i][expand], coeffs[:, 0, i][expand]) for i in range(7)]
+
+    cp = a[0] + T * (a[1] + T * (a[2] + T * (a[3] + T * a[4])))
+    h = a[0] + T * (a[1] / 2 + T * (a[2] / 3 + T * (a[3] / 4 + T * a[4] / 5))) + a[5] / T
+    s = a[0] * np.log(T) + T * (a[1] + T * (a[2] / 2 + T * (a[3] / 3 + T * a[4] / 4))) + a[6]
+
+    return R * cp, R * T * h, R * s
+
+def reaction_thermo(reactions, T):
+    """
+    ΔCp(T), ΔH(T) and ΔS(T) for reactions × temperatures (Kirchhoff's law).
+
+    The polynomials integrate Cp in closed form, so ΔH(T) = Σν·H_i(T) and
+    ΔS(T) = Σν·S_i(T) come from one matrix product against the species
+    property table, with no numerical integration. reactions are
+    signed-coefficient dicts (see stoichiometric_matrix) over NASA_SPECIES.
+    """
+    matrix = stoichiometric_matrix(reactions, index=NASA_INDEX)
+    nu = np.zeros(matrix["shape"])
+    np.add.at(nu, (matrix["rows"], matrix["cols"]), matrix["coef"])
+
+    cp, h, s = nasa_properties(T)
+    flat = (len(NASA_SPECIES), -1)
+    shape = (nu.shape[0],) + np.shape(T)
+
+    return (
+        (nu @ cp.reshape(flat)).reshape(shape),
+        (nu @ h.reshape(flat)).reshape(shape),
+        (nu @ s.reshape(flat)).reshape(shape),
+    )
+
 def reaction_profile(delta_h, Ea_forward, has_intermediate=False, catalyst=False):
     """
     Generates energy profile points for reaction coordinate
@@ -63,23 +227,76 @@ def heat_curve(T_initial, delta_h, steps=200):
 
     return heat_added, temperature
 
-def substance_heating_curve(substance, T_initial=300, q_max=500):
-    heat = np.linspace(0, q_max, 300)
+def _phase_columns(substances):
+    """
+    Phase data as aligned arrays from the substance database; substances
+    without it are a single phase with heat_capacity (default 3.0) and no
+    transitions. Sublimation (bp < mp) melts and boils at bp.
+    """
+    db = substance_database()
+    index = db.index
+    known = np.array([name in index for name in substances], dtype=bool)
+    rows = np.array([index.get(name, 0) for name in substances], dtype=np.intp)
+    phased = known & ~np.isnan(db.column("h_vap", rows))
 
-    if substance == "Water (H2O)":
-        temp = np.piecewise(
-            heat,
-            [heat < 100, (heat >= 100) & (heat < 300), heat >= 300],
-            [
-                lambda q: T_initial + 0.5*q,
-                lambda q: T_initial + 50,
-                lambda q: T_initial + 50 + 0.3*(q - 300),
-            ]
-        )
-    else:
-        Cp = HEAT_CAPACITY.get(substance, 3.0)
-        temp = T_initial + heat / Cp
+    cp = np.where(known, db.column("heat_capacity", rows), np.nan)
+    cp = np.where(np.isnan(cp), 3.0, cp)
+    columns = {"mp": "melting_point", "bp": "boiling_point", "cp_solid": "cp_solid",
+               "cp_liquid": "cp_liquid", "cp_gas": "cp_gas", "h_fus": "h_fus", "h_vap": "h_vap"}
+    single = {"mp": -np.inf, "bp": -np.inf, "cp_solid": cp, "cp_liquid": cp, "cp_gas": cp, "h_fus": 0.0, "h_vap": 0.0}
+
+    data = {key: np.where(phased, db.column(column, rows), single[key]) for key, column in columns.items()}
+    data["mp"] = np.minimum(data["mp"], data["bp"])
+    return data
+
+def heating_curve_breakpoints(substances, T_initial):
+    """
+    Heat (J/g) and temperature at the start of each heating-curve segment.
+
+    Segments are solid heating, melting, liquid heating, boiling and gas
+    heating; segments already passed at T_initial have zero width. Returns
+    (q_knots, T_knots, slopes), each (substances, 5), with slopes in K·g/J.
+    """
+    data = _phase_columns(substances)
+    T0 = np.broadcast_to(np.asarray(T_initial, dtype=float), data["mp"].shape)
+    mp, bp = data["mp"], data["bp"]
+
+    with np.errstate(invalid="ignore"):
+        q_melt_start = data["cp_solid"] * np.maximum(mp - T0, 0)
+        q_melt_end = q_melt_start + np.where(T0 < mp, data["h_fus"], 0)
+        q_boil_start = q_melt_end + data["cp_liquid"] * np.maximum(bp - np.maximum(T0, mp), 0)
+        q_boil_end = q_boil_start + np.where(T0 < bp, data["h_vap"], 0)
+
+    q_knots = np.stack([np.zeros_like(T0), q_melt_start, q_melt_end, q_boil_start, q_boil_end], axis=1)
+    T_melt, T_boil = np.maximum(T0, mp), np.maximum(T0, bp)
+    T_knots = np.stack([T0, T_melt, T_melt, T_boil, T_boil], axis=1)
+    zero = np.zeros_like(T0)
+    slopes = np.stack([1 / data["cp_solid"], zero, 1 / data["cp_liquid"], zero, 1 / data["cp_gas"]], axis=1)
+
+    return q_knots, T_knots, slopes
+
+def heating_curves(substances, T_initial, heat):
+    """
+    Temperature vs heat added (J/g) for many substances in one call.
+
+    Breakpoints are precomputed per substance and each heat value is placed
+    in its segment with a single searchsorted over all rows (rows are offset
+    so the flattened knots stay sorted). Returns (substances, len(heat)).
+    """
+    heat = np.asarray(heat, dtype=float)
+    q_knots, T_knots, slopes = heating_curve_breakpoints(substances, T_initial)
+    n_rows, n_knots = q_knots.shape
+
+    offset = (np.arange(n_rows) * (max(q_knots.max(initial=0), heat.max(initial=0)) + 1) * 2)[:, np.newaxis]
+    position = np.searchsorted((q_knots + offset).ravel(), (heat[np.newaxis, :] + offset).ravel(), side="right")
+    segment = (position - 1).reshape(n_rows, heat.size)
+
+    q_start = q_knots.ravel()[segment]
+    return T_knots.ravel()[segment] + slopes.ravel()[segment] * (heat[np.newaxis, :] - q_start)
 
+def substance_heating_curve(substance, T_initial=300, q_max=500):
+    heat = np.linspace(0, q_max, 300)
+    temp = heating_curves([substance], T_initial, heat)[0]
     return heat, temp
 
 def gibbs_energy(delta_h_kj, delta_s_j, T):
@@ -87,3 +304,40 @@ def gibbs_energy(delta_h_kj, delta_s_j, T):
     delta_g = delta_h - T*delta_s_j
     spontaneous = delta_g < 0
     return delta_g/1000, spontaneous
+
+def crossover_temperature(delta_h_kj, delta_s_j):
+    """
+    Temperature where ΔG = ΔH − TΔS changes sign, T = ΔH/ΔS (NaN if none > 0)
+    """
+    delta_h = np.asarray(delta_h_kj, dtype=float) * 1000
+    delta_s = np.asarray(delta_s_j, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = delta_h / delta_s
+    return np.where((delta_s != 0) & (T > 0), T, np.nan)
+
+def gibbs_sweep(delta_h_kj, delta_s_j, T):
+    """
+    ΔG(T) and K(T) = exp(−ΔG/RT) for reactions × temperatures.
+
+    delta_h_kj and delta_s_j are per-reaction arrays; results have shape
+    (reactions,) + np.shape(T). ln K is returned alongside K because K
+    overflows for strongly favoured reactions.
+    """
+    delta_h_kj = np.atleast_1d(np.asarray(delta_h_kj, dtype=float))
+    delta_s_j = np.atleast_1d(np.asarray(delta_s_j, dtype=float))
+    T = np.asarray(T, dtype=float)
+    expand = (slice(None),) + (np.newaxis,) * T.ndim
+
+    delta_g = delta_h_kj[expand] * 1000 - T * delta_s_j[expand]
+    ln_K = -delta_g / (R * T)
+    with np.errstate(over="ignore"):
+        K = np.exp(ln_K)
+
+    return {
+        "delta_g_kj": delta_g / 1000,
+        "ln_K": ln_K,
+        "K": K,
+        "spontaneous": delta_g < 0,
+        "crossover_T": crossover_temperature(delta_h_kj, delta_s_j),
+    }
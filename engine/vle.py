@@ -0,0 +1,182 @@
+import numpy as np
+
+from engine.imf import P_ATM, boiling_temperature, vapor_pressure
+
+def _batch(composition, *conditions):
+    """
+    Compositions as normalized (batch, components) and conditions as (batch,)
+    """
+    composition = np.atleast_2d(np.asarray(composition, dtype=float))
+    conditions = [np.atleast_1d(np.asarray(c, dtype=float)) for c in conditions]
+    batch = np.broadcast_shapes(composition.shape[:1], *[c.shape for c in conditions])[0]
+
+    composition = np.broadcast_to(composition, (batch, composition.shape[1]))
+    composition = composition / composition.sum(axis=1, keepdims=True)
+    return [composition] + [np.broadcast_to(c, (batch,)) for c in conditions]
+
+def _saturation(components, T, derivative=False):
+    """
+    Pure-component vapor pressures (kPa) as (batch, components); Antoine
+    fits are extrapolated so Newton iterates may leave the fit ranges
+    """
+    if derivative:
+        P, slope = vapor_pressure(components, T, derivative=True, extrapolate=True)
+        return P.T, slope.T
+    return vapor_pressure(components, T, extrapolate=True).T
+
+def _safeguarded_newton(residual, x0, lo, hi, increasing, tol, max_iter):
+    """
+    Root of a monotonic residual per row inside [lo, hi].
+
+    residual(x, rows) returns (f, df) for the given rows. A Newton step
+    that leaves the current bracket is replaced by bisection, and converged
+    rows drop out of the working set.
+    """
+    x, lo, hi = x0.copy(), lo.copy(), hi.copy()
+    converged = np.zeros(x.size, dtype=bool)
+    active = np.flatnonzero(np.isfinite(x))
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        f, df = residual(x[active], active)
+
+        done = np.abs(f) <= tol
+        converged[active[done]] = True
+
+        above = (f > 0) == increasing
+        hi[active] = np.where(above, x[active], hi[active])
+        lo[active] = np.where(above, lo[active], x[active])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = x[active] - f / df
+        inside = (step > lo[active]) & (step < hi[active])
+        x[active] = np.where(done, x[active], np.where(inside, step, (lo[active] + hi[active]) / 2))
+
+        # A bracket narrower than tol pins the root as well as a small residual
+        collapsed = hi[active] - lo[active] <= tol * np.maximum(np.abs(x[active]), 1)
+        converged[active[collapsed]] = True
+        active = active[~(done | collapsed)]
+
+    return x, converged
+
+def k_values(components, T, P):
+    """
+    Raoult's-law K_i = P_sat,i(T) / P, (batch, components)
+    """
+    T, P = np.broadcast_arrays(np.atleast_1d(np.asarray(T, dtype=float)), np.asarray(P, dtype=float))
+    return _saturation(components, T) / P[:, np.newaxis]
+
+def bubble_pressure(components, x, T):
+    """
+    Bubble pressure P = Σ x_i·P_sat,i and incipient vapor y for each liquid
+    """
+    x, T = _batch(x, T)
+    p_sat = _saturation(components, T)
+    P = np.sum(x * p_sat, axis=1)
+    return {"P": P, "y": x * p_sat / P[:, np.newaxis]}
+
+def dew_pressure(components, y, T):
+    """
+    Dew pressure P = 1 / Σ(y_i / P_sat,i) and incipient liquid x for each vapor
+    """
+    y, T = _batch(y, T)
+    p_sat = _saturation(components, T)
+    P = 1 / np.sum(y / p_sat, axis=1)
+    return {"P": P, "x": y * P[:, np.newaxis] / p_sat}
+
+def _temperature_bracket(components, composition, P):
+    """
+    Pure-component boiling temperatures at P span every bubble and dew point
+    """
+    T_b = boiling_temperature(components, P, extrapolate=True).T  # (batch, components)
+    present = composition > 0
+    lo = np.min(np.where(present, T_b, np.inf), axis=1)
+    hi = np.max(np.where(present, T_b, -np.inf), axis=1)
+    guess = np.sum(composition * T_b, axis=1)
+    return guess, lo, hi
+
+def bubble_temperature(components, x, P=P_ATM, tol=1e-10, max_iter=100):
+    """
+    Bubble temperature of each liquid x at pressure P (kPa).
+
+    Solves ln Σ x_i·P_sat,i(T) = ln P by safeguarded Newton, bracketed by
+    the pure-component boiling points. Returns T, incipient vapor y and a
+    converged flag per point.
+    """
+    x, P = _batch(x, P)
+    guess, lo, hi = _temperature_bracket(components, x, P)
+
+    def residual(T, rows):
+        p_sat, slope = _saturation(components, T, derivative=True)
+        total = np.sum(x[rows] * p_sat, axis=1)
+        return np.log(total / P[rows]), np.sum(x[rows] * p_sat * slope, axis=1) / total
+
+    T, converged = _safeguarded_newton(residual, guess, lo, hi, True, tol, max_iter)
+    p_sat = _saturation(components, T)
+    y = x * p_sat / P[:, np.newaxis]
+    return {"T": T, "y": y / y.sum(axis=1, keepdims=True), "converged": converged}
+
+def dew_temperature(components, y, P=P_ATM, tol=1e-10, max_iter=100):
+    """
+    Dew temperature of each vapor y at pressure P (kPa); see
+    bubble_temperature. Returns T, incipient liquid x and a converged flag.
+    """
+    y, P = _batch(y, P)
+    guess, lo, hi = _temperature_bracket(components, y, P)
+
+    def residual(T, rows):
+        p_sat, slope = _saturation(components, T, derivative=True)
+        terms = y[rows] / p_sat
+        total = np.sum(terms, axis=1)
+        return np.log(total * P[rows]), -np.sum(terms * slope, axis=1) / total
+
+    T, converged = _safeguarded_newton(residual, guess, lo, hi, False, tol, max_iter)
+    x = y * P[:, np.newaxis] / _saturation(components, T)
+    return {"T": T, "x": x / x.sum(axis=1, keepdims=True), "converged": converged}
+
+def rachford_rice(z, K, tol=1e-12, max_iter=100):
+    """
+    Vapor fraction β solving Σ z_i(K_i − 1) / (1 + β(K_i − 1)) = 0 per row.
+
+    Subcooled feeds (Σ z·K <= 1) return β = 0 and superheated feeds
+    (Σ z/K <= 1) β = 1; otherwise the residual is strictly decreasing on
+    (0, 1) and is solved by safeguarded Newton. Returns (β, converged).
+    """
+    z = np.atleast_2d(z)
+    K = np.atleast_2d(K)
+    liquid = np.sum(z * K, axis=1) <= 1
+    vapor = np.sum(z / K, axis=1) <= 1
+    two_phase = ~(liquid | vapor)
+
+    def residual(beta, rows):
+        km1 = K[rows] - 1
+        denominator = 1 + beta[:, np.newaxis] * km1
+        f = np.sum(z[rows] * km1 / denominator, axis=1)
+        df = -np.sum(z[rows] * km1**2 / denominator**2, axis=1)
+        return f, df
+
+    n = z.shape[0]
+    beta0 = np.where(two_phase, 0.5, np.nan)
+    beta, converged = _safeguarded_newton(residual, beta0, np.zeros(n), np.ones(n), False, tol, max_iter)
+
+    beta = np.where(liquid, 0.0, np.where(vapor, 1.0, beta))
+    return beta, converged | ~two_phase
+
+def flash(components, z, T, P=P_ATM, tol=1e-12, max_iter=100):
+    """
+    Isothermal flash of many feeds with Raoult's-law K-values.
+
+    z is (feeds, components) or one composition; T (K) and P (kPa) broadcast
+    over the feeds. Returns vapor fraction beta, liquid x and vapor y
+    (feeds, components), the K-values and a converged flag.
+    """
+    z, T, P = _batch(z, T, P)
+    K = _saturation(components, T) / P[:, np.newaxis]
+    beta, converged = rachford_rice(z, K, tol, max_iter)
+
+    x = z / (1 + beta[:, np.newaxis] * (K - 1))
+    x = x / x.sum(axis=1, keepdims=True)
+    y = K * x
+    y = y / y.sum(axis=1, keepdims=True)
+    return {"beta": beta, "x": x, "y": y, "K": K, "converged": converged}
@@ -1,4 +1,5 @@
 import streamlit as st
+import numpy as np
 import matplotlib.pyplot as plt
 
 from engine.imf import (
@@ -6,6 +7,8 @@ from engine.imf import (
     generate_potential_energy_data,
     generate_bp_mp_vs_molar_mass,
     generate_vapor_pressure_data,
+    vapor_pressure,
+    antoine_range,
     get_substance_outputs
 )
 
@@ -43,17 +46,23 @@ for s in substances_selected:
     st.sidebar.write(f"Molar Mass: {data['molar_mass']} g/mol")
     st.sidebar.write(f"Melting Point: {data['melting_point']} K")
     st.sidebar.write(f"Boiling Point: {data['boiling_point']} K")
-    st.sidebar.write(f"Vapor Pressure @298K: {data['vapor_pressure_298']} kPa")
+    vp_298 = vapor_pressure([s], 298)[0, 0]
+    (t_min,), (t_max,) = antoine_range([s])
+    if np.isfinite(vp_298):
+        st.sidebar.write(f"Vapor Pressure @298K: {vp_298:.3g} kPa")
+    else:
+        st.sidebar.write(f"Vapor Pressure @298K: outside Antoine fit range ({t_min:.0f}–{t_max:.0f} K)")
     st.sidebar.write(f"Internuclear Distance: {data['internuclear_distance']} nm")
 
 st.sidebar.markdown(f"""
 ### Equations
 
-**Potential Energy Curve**
-- U(r) = A/r^12 - B/r^6
+**Potential Energy Curve (Lennard-Jones)**
+- U(r) = 4ε[(σ/r)^12 - (σ/r)^6]
 
-**Vapor Pressure Approximation**
-- P = P_0 e^k(T - 298)
+**Vapor Pressure (Antoine)**
+- log10 P = A - B/(C + T)
+- Each curve covers only its fitted temperature range
 
 **Constants**
 - R = 8.314 J/mol·K
@@ -64,20 +73,23 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("Potential Energy & Phase Properties")
 
-    pe_df = generate_potential_energy_data()
+    pe_df = generate_potential_energy_data(substances_selected)
     bp_df = generate_bp_mp_vs_molar_mass()
 
     fig, ax1 = plt.subplots()
 
-    ax1.plot(
-        pe_df["Internuclear Distance (nm)"],
-        pe_df["Potential Energy"],
-        color="blue",
-        label="Potential Energy"
-    )
+    for s, curve in pe_df.groupby("Substance", sort=False):
+        ax1.plot(
+            curve["Internuclear Distance (nm)"],
+            curve["Potential Energy (kJ/mol)"],
+            label=s
+        )
 
     ax1.set_xlabel("Internuclear Distance (nm)")
-    ax1.set_ylabel("Potential Energy")
+    ax1.set_ylabel("Potential Energy (kJ/mol)")
+    ax1.axhline(0, color="gray", linewidth=0.5)
+    if substances_selected:
+        ax1.legend()
 
     # fig, ax2 = plt.subplots()
     # # ax2 = ax1.twinx()
@@ -110,6 +122,7 @@ with col2:
 
     ax.set_xlabel("Temperature (K)")
     ax.set_ylabel("Vapor Pressure (kPa)")
+    ax.set_yscale("log")
     ax.legend()
 
     st.pyplot(fig)
@@ -1,12 +1,17 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.colors import ListedColormap
 
 from engine.properties import (
     SUBSTANCES,
-    PERIODIC_TRENDS,
+    element_rows,
+    element_property,
+    periodic_trends,
     get_substance_data,
-    predict_phase,
+    phase_name,
+    phase_codes,
     average_kinetic_energy,
     imf_strength
 )
@@ -50,13 +55,17 @@ st.sidebar.markdown("---")
 
 st.sidebar.subheader("Outputs")
 
+# Phases of every listed substance at the selected temperature, in one call
+substance_names = list(SUBSTANCES.keys())
+phases = dict(zip(substance_names, (phase_name(c) for c in phase_codes(substance_names, [temperature])[:, 0])))
+
 def display_sidebar_outputs(substance_name, temp):
     if substance_name == "None":
         st.sidebar.info("No substance selected.")
         return
 
     data = get_substance_data(substance_name)
-    phase = predict_phase(data, temp)
+    phase = phases[substance_name]
 
     st.sidebar.markdown(f"**{substance_name}**")
     st.sidebar.write(f"- Atomic Radius: {data.get('atomic_radius', 'N/A')} pm")
@@ -91,6 +100,7 @@ LDF < Dipole–Dipole < Hydrogen Bonding < Ionic Forces
 - T < MP → solid  
 - MP ≤ T < BP → liquid  
 - T ≥ BP → gas
+- BP < MP (sublimation) → solid below BP, gas above
 
 **Constants**
 - R = 8.314 J·mol⁻¹·K⁻¹
@@ -105,7 +115,7 @@ def display_properties(substance, col):
         return
 
     data = get_substance_data(substance)
-    phase = predict_phase(data, temperature)
+    phase = phases[substance]
 
     col.markdown(f"### {substance}")
     col.write(f"**Molar Mass:** {data['molar_mass']} g/mol")
@@ -128,10 +138,13 @@ with col1:
         ["Atomic Radius (pm)", "Electronegativity", "Ionization Energy (kJ/mol)"]
     )
 
+    periods = st.multiselect("Periods", list(range(1, 8)), default=[2])
+    trend_rows = element_rows(period=periods)
+
     fig1, ax1 = plt.subplots()
     ax1.plot(
-        PERIODIC_TRENDS["Atomic Number"],
-        PERIODIC_TRENDS[trend_y],
+        element_property("Atomic Number", trend_rows),
+        element_property(trend_y, trend_rows),
         marker="o",
         lw=2
     )
@@ -141,8 +154,7 @@ with col1:
     ax1.set_title(f"{trend_y} vs Atomic Number")
 
     st.pyplot(fig1)
-
-    st.dataframe(PERIODIC_TRENDS)
+    st.dataframe(periodic_trends(trend_rows))
 
 with col2:
     st.subheader("Intermolecular Forces vs Boiling Point")
@@ -172,6 +184,29 @@ with col2:
     st.pyplot(fig2)
     st.dataframe(imf_df)
 
+st.subheader("Phase Map")
+
+map_T = np.linspace(10, 2000, 400)
+codes = phase_codes(substance_names, map_T)
+
+fig3, ax3 = plt.subplots(figsize=(10, 3))
+ax3.imshow(
+    codes,
+    aspect="auto",
+    interpolation="nearest",
+    cmap=ListedColormap(["tab:blue", "tab:green", "tab:orange"]),
+    vmin=0,
+    vmax=2,
+    extent=(map_T[0], map_T[-1], len(substance_names) - 0.5, -0.5)
+)
+ax3.axvline(temperature, color="black", linestyle="--")
+ax3.set_yticks(range(len(substance_names)))
+ax3.set_yticklabels(substance_names)
+ax3.set_xlabel("Temperature (K)")
+ax3.set_title("Solid (blue) / Liquid (green) / Gas (orange) at 1 atm")
+
+st.pyplot(fig3)
+
 st.header("Properties Concepts")
 
 st.markdown(f"""
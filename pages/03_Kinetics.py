@@ -130,7 +130,7 @@ with col2:
         "Only molecules with KE ≥ Ea can successfully react."
     )
 
-    fraction_reactive = np.sum(f_v[KE>=Ea])/np.sum(f_v) if Ea else 0
+    fraction_reactive = kinetics.reactive_fraction(temperature, Ea, mass) if Ea else 0
     if fraction_reactive < 0.05:
         st.warning(f"Only {fraction_reactive*100:.1f}% of molecules exceed Ea. Increase temperature to accelerate. Activation energy is too high for efficient reaction.")
     elif fraction_reactive < 0.2:
@@ -36,10 +36,17 @@ Ea_forward = st.sidebar.slider(
 has_intermediate = st.sidebar.checkbox("Reaction has intermediate")
 catalyst = st.sidebar.checkbox("Catalyst present")
 
+curve_start = st.sidebar.radio(
+    "Heating curve starts at",
+    ["Just below melting point", "Temperature slider"]
+)
+
 st.sidebar.info(
-    "💧 Water is shown with a realistic heating curve because its phase-change "
-    "behavior (melting and boiling) is well-known. Other substances are currently "
-    "modeled as single-phase materials with no phase transitions."
+    "💧 Heating curves use each substance's melting/boiling points, heat "
+    "capacities and latent heats, so every phase change appears as a plateau. "
+    "By default they start just below the melting point, since the slider "
+    "range (250 K and up) would skip the solid and liquid phases of most "
+    "species; choose \"Temperature slider\" to start at the slider value."
 )
 
 reactants = [reactant1, reactant2]
@@ -62,8 +69,18 @@ elif reactant2 != "None":
 elif reactant1 != "None":
     selected_substance = reactant1
 
+# Start just below the melting point so every phase change is on the curve,
+# but never at or below 0 K for cryogenic species such as H2
+phase = thermodynamics.PHASE_DATA.get(selected_substance)
+if phase and curve_start == "Just below melting point":
+    T_melt = min(phase["mp"], phase["bp"])
+    T_start = max(T_melt - 20, 0.5 * T_melt)
+else:
+    T_start = temperature
+q_knots, _, _ = thermodynamics.heating_curve_breakpoints([selected_substance], T_start)
+
 heat_q, temp_curve = thermodynamics.substance_heating_curve(
-    selected_substance, temperature
+    selected_substance, T_start, q_max=max(q_knots[0, -1] * 1.2, 500)
 )
 
 st.sidebar.subheader("Thermodynamics Outputs")
@@ -165,7 +182,7 @@ Water’s heating curve includes:
 - Large ΔH_vap due to hydrogen bonding
 - Clear plateaus at phase changes
 
-Other substances are currently shown using a **simplified model** without phase transitions due to missing thermodynamic data.
+Other substances follow the same model with their own phase data; CO₂ sublimes at 1 atm, so it shows a single plateau.
 """)
 
 st.markdown("""
@@ -22,6 +22,10 @@ with st.sidebar.expander("Acids & Bases Glossary"):
 
 st.sidebar.header("Inputs")
 
+acid_type = st.sidebar.selectbox(
+    "Acid Type", ["Strong Acid"] + list(WEAK_ACIDS.keys())
+)
+
 acid_molarity = st.sidebar.slider(
     "Acid Molarity (M)", 0.1, 2.0, 1.0
 )
@@ -45,12 +49,24 @@ outputs = calculate_outputs(
     base_volume
 )
 
-titration_df, equivalence_volume = generate_titration_curve(
-    acid_molarity,
-    acid_volume,
-    base_molarity,
-    max_base_volume=0.10
-)
+if acid_type == "Strong Acid":
+    titration_df, equivalence_volume = generate_titration_curve(
+        acid_molarity,
+        acid_volume,
+        base_molarity,
+        max_base_volume=0.10,
+        adaptive=True
+    )
+    equivalence_volumes = [equivalence_volume]
+else:
+    titration_df, equivalence_volumes = generate_weak_titration_curve(
+        acid_molarity,
+        acid_volume,
+        base_molarity,
+        max_titrant_volume=0.10,
+        ka=WEAK_ACIDS[acid_type],
+        points=200
+    )
 
 absorbance_df = generate_absorbance_data(
     concentration_max=acid_molarity
@@ -94,11 +110,12 @@ with col1:
         titration_df["Volume of Titrant Added (L)"],
         titration_df["pH"]
     )
-    ax.axvline(
-        equivalence_volume,
-        linestyle="--",
-        label="Equivalence Point"
-    )
+    for i, Veq in enumerate(equivalence_volumes):
+        ax.axvline(
+            Veq,
+            linestyle="--",
+            label="Equivalence Point" if i == 0 else None
+        )
     ax.set_xlabel("Volume of Titrant Added (L)")
     ax.set_ylabel("pH")
     ax.legend()
@@ -0,0 +1,17 @@
+import numpy as np
+
+from engine.acids_bases import TitrationStream, titration_ph_matrix
+
+def test_stream_matches_titration_matrix_through_equivalence():
+    stream = TitrationStream(0.1, 0.025, 0.1)
+    ph = [stream.push(0.001) for _ in range(40)]
+    expected = titration_ph_matrix(0.1, 0.025, 0.1, np.arange(1, 41) * 0.001)
+    np.testing.assert_allclose(ph, expected, atol=1e-6)
+
+def test_stream_stays_physical_over_many_small_doses():
+    stream = TitrationStream(0.1, 0.025, 0.1)
+    stream.push_many(np.full(50000, 2.5e-7))
+    for _ in range(50000):
+        ph = stream.push(2.5e-7)
+    assert abs(ph - 7.0) < 1e-3
+    np.testing.assert_allclose(stream.titrant_volume, 0.025, rtol=1e-14)
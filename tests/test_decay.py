@@ -0,0 +1,12 @@
+import numpy as np
+
+from engine.decay import simulate_decay
+
+def test_leap_dead_time_matches_gillespie():
+    t = np.arange(0, 41, 4.0)
+    exact = simulate_decay(1e-4, 5000, t, replicates=4000, method="gillespie", dead_time=2.0, seed=1)
+    leap = simulate_decay(1e-4, 5000, t, replicates=4000, method="leap", dead_time=2.0, seed=2)
+
+    # Analytic non-paralyzable rate λ / (1 + λτ) with λ = 0.5 /s over 4 s bins
+    np.testing.assert_allclose(leap["recorded_mean"][1:].mean(), 1.0, rtol=0.02)
+    np.testing.assert_allclose(leap["recorded_mean"], exact["recorded_mean"], rtol=0.05)
@@ -0,0 +1,17 @@
+import numpy as np
+
+from engine.database import substance_database
+from engine.imf import P_ATM, boiling_temperature, generate_vapor_pressure_data, vapor_pressure
+
+def test_antoine_fits_cover_normal_boiling_points():
+    db = substance_database()
+    rows = db.present("antoine_a")
+    formulas = db.column("formula", rows).tolist()
+
+    T_b = boiling_temperature(formulas, P_ATM)[:, 0]
+    np.testing.assert_allclose(T_b, db.column("boiling_point", rows), atol=0.5)
+
+def test_water_boils_inside_its_fit():
+    assert np.isfinite(vapor_pressure(["H2O"], 373.15)).all()
+    data = generate_vapor_pressure_data("H2O")
+    assert data["Vapor Pressure (kPa)"].max() >= P_ATM